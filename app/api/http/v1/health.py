@@ -1,8 +1,9 @@
 """Health check and monitoring endpoints."""
 
+import json
 from datetime import datetime, timezone
 from typing import Dict, Any
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 
 from app.api.http.dependencies import (
     get_deeplake_service, get_auth_service, get_cache_manager, get_metrics_service,
@@ -19,6 +20,14 @@ from app.config.settings import settings
 router = APIRouter(tags=["health"])
 
 
+def _probe_response(probe_status: str) -> Response:
+    """Serialize a Kubernetes probe body directly, skipping response validation."""
+    body = {"status": probe_status, "timestamp": datetime.now(timezone.utc).isoformat()}
+    return Response(content=json.dumps(body), media_type="application/json")
+
+
+# HealthResponse is serialized by FastAPI's Pydantic JSON fast path, so no
+# jsonable_encoder pass runs per request
 @router.get("/health", response_model=HealthResponse)
 async def health_check(
     deeplake_service: DeepLakeService = Depends(get_deeplake_service),
@@ -58,7 +67,7 @@ async def health_check(
         status=overall_status,
         service="Tributary AI services for DeepLake",
         version="1.0.0",
-        timestamp=datetime.now(),
+        timestamp=datetime.now(timezone.utc),
         dependencies=dependencies
     )
 
@@ -66,7 +75,7 @@ async def health_check(
 @router.get("/health/ready")
 async def readiness_check(
     deeplake_service: DeepLakeService = Depends(get_deeplake_service)
-) -> Dict[str, Any]:
+) -> Response:
     """Readiness check for Kubernetes."""
     try:
         # Verify critical services are ready
@@ -77,7 +86,7 @@ async def readiness_check(
                 detail="Storage location not accessible"
             )
         
-        return {"status": "ready", "timestamp": datetime.now()}
+        return _probe_response("ready")
         
     except Exception as e:
         raise HTTPException(
@@ -87,9 +96,9 @@ async def readiness_check(
 
 
 @router.get("/health/live")
-async def liveness_check() -> Dict[str, Any]:
+async def liveness_check() -> Response:
     """Liveness check for Kubernetes."""
-    return {"status": "alive", "timestamp": datetime.now()}
+    return _probe_response("alive")
 
 
 @router.get("/metrics", response_model=MetricsResponse)
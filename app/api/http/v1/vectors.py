@@ -3,7 +3,9 @@
 # pylint: disable=W0621
 
 from typing import List, Dict, Any
-from fastapi import APIRouter, Depends, HTTPException, status, Path
+import numpy as np
+from fastapi import APIRouter, Depends, HTTPException, status, Path, Query, Request
+from pydantic import ValidationError
 
 from app.api.http.dependencies import (
     get_deeplake_service, get_current_tenant, authorize_operation,
@@ -25,6 +27,9 @@ import pdb
 
 router = APIRouter(prefix="/datasets/{dataset_id}/vectors", tags=["vectors"])
 
+# Same per-request limit as VectorBatchInsert.vectors
+MAX_BINARY_BATCH_VECTORS = 1000
+
 
 @router.post("/", status_code=status.HTTP_201_CREATED)
 async def insert_vector(
@@ -154,6 +159,124 @@ async def insert_vectors_batch(
         )
 
 
+@router.post("/batch/binary", response_model=VectorBatchResponse, status_code=status.HTTP_201_CREATED)
+async def insert_vectors_binary(
+    request: Request,
+    dataset_id: str = Path(..., description="Dataset ID"),
+    document_id_prefix: str = Query("doc-", description="Prefix for generated document IDs"),
+    start_index: int = Query(0, ge=0, description="Number appended to the prefix for the first vector"),
+    tenant_id: str = Depends(get_current_tenant),
+    deeplake_service: DeepLakeService = Depends(get_deeplake_service),
+    cache_manager: CacheManager = Depends(get_cache_manager),
+    metrics_service: MetricsService = Depends(get_metrics_service),
+    auth_info: dict = Depends(authorize_operation("insert_vector"))
+) -> VectorBatchResponse:
+    """Insert vectors sent as raw little-endian float32 rows.
+
+    The body is the row-major ``(count, dimensions)`` matrix with no header;
+    the row width is taken from the dataset. Vector ``i`` gets the document ID
+    ``{document_id_prefix}{start_index + i}``. Bodies over the vector limit
+    and non-finite values are rejected with 400.
+    """
+
+    import time
+    start_time = time.time()
+
+    try:
+        dataset = await deeplake_service.get_dataset(dataset_id, tenant_id)
+
+        # Refuse oversized uploads from the declared length, before buffering them
+        row_bytes = dataset.dimensions * 4
+        content_length = request.headers.get("content-length")
+        if content_length and content_length.isdigit() and int(content_length) > MAX_BINARY_BATCH_VECTORS * row_bytes:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"At most {MAX_BINARY_BATCH_VECTORS} vectors per request"
+            )
+
+        body = await request.body()
+        if not body or len(body) % row_bytes:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Body must hold whole float32 vectors of {dataset.dimensions} dimensions"
+            )
+
+        matrix = np.frombuffer(body, dtype="<f4").reshape(-1, dataset.dimensions)
+        # Chunked uploads carry no Content-Length, so the row count is checked again
+        if len(matrix) > MAX_BINARY_BATCH_VECTORS:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"At most {MAX_BINARY_BATCH_VECTORS} vectors per request"
+            )
+        if not np.isfinite(matrix).all():
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Vector values must be finite"
+            )
+
+        # Run the full schema over the last row, whose document ID is the longest;
+        # the other rows differ only in index digits and in finite values from the
+        # same matrix, so they skip per-float validation and go straight to the service
+        try:
+            VectorCreate(
+                document_id=f"{document_id_prefix}{start_index + len(matrix) - 1}",
+                values=matrix[-1].tolist()
+            )
+        except ValidationError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e)
+            )
+
+        vectors = [
+            VectorCreate.model_construct(document_id=f"{document_id_prefix}{start_index + i}", values=row)
+            for i, row in enumerate(matrix)
+        ]
+
+        result = await deeplake_service.insert_vectors(
+            dataset_id=dataset_id,
+            vectors=vectors,
+            tenant_id=tenant_id
+        )
+
+        # Update metrics
+        duration = time.time() - start_time
+        metrics_service.record_vector_insertion(
+            dataset_id, result.inserted_count, duration, len(vectors), tenant_id
+        )
+        metrics_service.update_vector_count(
+            dataset_id,
+            (await deeplake_service.get_dataset(dataset_id, tenant_id)).vector_count,
+            tenant_id
+        )
+
+        # Invalidate dataset cache
+        await cache_manager.invalidate_dataset_cache(dataset_id, tenant_id)
+
+        return result
+
+    except HTTPException:
+        raise
+    except DatasetNotFoundException as e:
+        metrics_service.record_error("dataset_not_found", "insert_vectors_binary", tenant_id)
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+    except DeepLakeServiceException as e:
+        metrics_service.record_error(e.error_code or "unknown", "insert_vectors_binary", tenant_id)
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception:
+        metrics_service.record_error("internal_error", "insert_vectors_binary", tenant_id)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal server error"
+        )
+
+
 @router.get("/", response_model=List[VectorResponse])
 async def list_vectors(
     dataset_id: str = Path(..., description="Dataset ID"),
@@ -30,6 +30,8 @@ class DatasetCreate(BaseModel):
     dimensions: int = Field(..., ge=1, le=10000, description="Vector dimensions")
     metric_type: str = Field(default="cosine", description="Distance metric type")
     index_type: str = Field(default="default", description="Index type: default, flat, hnsw, ivf")
+    vector_dtype: str = Field(default="float32", description="Stored vector precision: float32, float16")
+    normalize_vectors: bool = Field(default=False, description="Store vectors scaled to unit length")
     metadata: Optional[Dict[str, str]] = Field(default=None, description="Dataset metadata")
     storage_location: Optional[str] = Field(None, description="Custom storage location")
     overwrite: bool = Field(default=False, description="Overwrite existing dataset")
@@ -49,6 +51,14 @@ class DatasetCreate(BaseModel):
         if v not in allowed_types:
             raise ValueError(f"index_type must be one of {allowed_types}")
         return v
+    
+    @field_validator('vector_dtype')
+    @classmethod
+    def validate_vector_dtype(cls, v: str) -> str:
+        allowed_dtypes = ['float32', 'float16']
+        if v not in allowed_dtypes:
+            raise ValueError(f"vector_dtype must be one of {allowed_dtypes}")
+        return v
 
 
 class DatasetUpdate(BaseModel):
@@ -68,6 +78,8 @@ class DatasetResponse(BaseModel):
     dimensions: int
     metric_type: str
     index_type: str
+    vector_dtype: str = "float32"
+    normalize_vectors: bool = False
     metadata: Dict[str, Any]
     storage_location: str
     vector_count: int = 0
@@ -12,6 +12,12 @@ from concurrent.futures import ThreadPoolExecutor
 import deeplake
 import numpy as np
 from tenacity import retry, stop_after_attempt, wait_exponential
+try:
+    import simsimd
+    HAS_SIMSIMD = True
+except ImportError:
+    simsimd = None
+    HAS_SIMSIMD = False
 
 from app.config.settings import settings
 from app.config.logging import get_logger, LoggingMixin
@@ -31,9 +37,18 @@ from app.services.index_service import IndexService, IndexType, IndexConfig, HNS
 class DeepLakeService(LoggingMixin):
     """Core service for Deep Lake operations."""
     
-    def __init__(self) -> None:
+    # Target size of one block of float32 embeddings scored at a time during search (~L2 cache)
+    SEARCH_BLOCK_BYTES = 256 * 1024
+    
+    # Deep Lake element types for DatasetCreate.vector_dtype; search always scores in float32
+    VECTOR_DTYPES = {
+        'float32': deeplake.types.Float32,
+        'float16': deeplake.types.Float16,
+    }
+    
+    def __init__(self, storage_location: Optional[str] = None) -> None:
         super().__init__()
-        self.storage_location = settings.deeplake.storage_location
+        self.storage_location = storage_location or settings.deeplake.storage_location
         self.token = settings.deeplake.token
         self.org_id = settings.deeplake.org_id
         self.datasets: Dict[str, Any] = {}
@@ -132,7 +147,7 @@ class DeepLakeService(LoggingMixin):
             schema = {
                 'id': deeplake.types.Text(),
                 'document_id': deeplake.types.Text(), 
-                'embedding': deeplake.types.Array(deeplake.types.Float32(), shape=[dataset_create.dimensions]),
+                'embedding': deeplake.types.Array(self.VECTOR_DTYPES[dataset_create.vector_dtype](), shape=[dataset_create.dimensions]),
                 'content': deeplake.types.Text(),
                 'chunk_count': deeplake.types.Int32(),
                 'metadata': deeplake.types.Text(),  # JSON string for metadata
@@ -160,6 +175,8 @@ class DeepLakeService(LoggingMixin):
                 'dimensions': dataset_create.dimensions,
                 'metric_type': dataset_create.metric_type,
                 'index_type': dataset_create.index_type,
+                'vector_dtype': dataset_create.vector_dtype,
+                'normalize_vectors': dataset_create.normalize_vectors,
                 'tenant_id': tenant_id or '',
                 'created_at': datetime.now(timezone.utc).isoformat(),
                 'updated_at': datetime.now(timezone.utc).isoformat(),
@@ -187,6 +204,8 @@ class DeepLakeService(LoggingMixin):
                 dimensions=dataset_create.dimensions,
                 metric_type=dataset_create.metric_type,
                 index_type=dataset_create.index_type,
+                vector_dtype=dataset_create.vector_dtype,
+                normalize_vectors=dataset_create.normalize_vectors,
                 metadata=dataset_create.metadata or {},
                 storage_location=dataset_path,
                 vector_count=0,
@@ -229,7 +248,9 @@ class DeepLakeService(LoggingMixin):
                 dimensions=info.get('dimensions', 0),
                 metric_type=info.get('metric_type', 'cosine'),
                 index_type=info.get('index_type', 'default'),
-                metadata={k: v for k, v in info.items() if k not in ['name', 'description', 'dimensions', 'metric_type', 'index_type', 'tenant_id', 'created_at', 'updated_at']},
+                vector_dtype=info.get('vector_dtype', 'float32'),
+                normalize_vectors=info.get('normalize_vectors', False),
+                metadata={k: v for k, v in info.items() if k not in ['name', 'description', 'dimensions', 'metric_type', 'index_type', 'vector_dtype', 'normalize_vectors', 'tenant_id', 'created_at', 'updated_at']},
                 storage_location=dataset_path,
                 vector_count=len(dataset),
                 storage_size=self._get_directory_size(dataset_path),
@@ -348,6 +369,7 @@ class DeepLakeService(LoggingMixin):
             # Get dataset dimensions from our metadata
             dataset_info = await self._load_dataset_metadata(dataset_path)
             expected_dimensions = dataset_info.get('dimensions', 0)
+            normalize = dataset_info.get('normalize_vectors', False)
             self.logger.info("Dataset metadata loaded", dataset_id=dataset_id, expected_dimensions=expected_dimensions)
             
             inserted_count = 0
@@ -355,6 +377,9 @@ class DeepLakeService(LoggingMixin):
             failed_count = 0
             error_messages = []
             
+            # Rows that passed validation, appended in a single call below
+            pending_rows = []
+            
             # Process vectors
             for vector in vectors:
                 try:
@@ -382,7 +407,7 @@ class DeepLakeService(LoggingMixin):
                     vector_data = {
                         'id': str(vector_id),
                         'document_id': str(vector.document_id),
-                        'embedding': np.array(vector.values, dtype=np.float32),
+                        'embedding': self._embedding_array(vector.values, normalize),
                         'content': str(vector.content or ''),
                         'chunk_count': int(vector.chunk_count or 1),
                         'metadata': metadata_json,
@@ -396,27 +421,29 @@ class DeepLakeService(LoggingMixin):
                         'updated_at': now
                     }
                     
-                    self.logger.debug("Appending vector to dataset", vector_id=vector_id, data_keys=list(vector_data.keys()))
-                    
-                    # Append to dataset with correct Deep Lake v4 format
-                    # For single samples, Deep Lake v4 expects a list containing a dictionary: [{...}]
-                    try:
-                        dataset.append([vector_data])  # Wrap in list for single sample
-                        inserted_count += 1
-                    except Exception as append_error:
-                        # Handle specific Deep Lake 4.0 append errors
-                        if "FileNotFoundError" in str(append_error) or "chunks" in str(append_error):
-                            self.logger.error("Dataset corruption detected during append", error=str(append_error))
-                            # Try to recreate the dataset
-                            raise StorageException(f"Dataset corruption detected: {str(append_error)}", "dataset_append")
-                        else:
-                            raise append_error
+                    pending_rows.append((vector, vector_data))
                     
                 except Exception as e:
                     failed_count += 1
                     error_messages.append(f"Vector {vector.id or 'unknown'}: {str(e)}")
                     self.logger.warning("Failed to insert vector", vector_id=vector.id, error=str(e))
             
+            # Append all valid rows at once; Deep Lake v4 takes a list of row dictionaries: [{...}, ...]
+            if pending_rows:
+                self.logger.debug("Appending vectors to dataset", dataset_id=dataset_id, count=len(pending_rows))
+                try:
+                    dataset.append([vector_data for _, vector_data in pending_rows])
+                    inserted_count += len(pending_rows)
+                except Exception as append_error:
+                    # Handle specific Deep Lake 4.0 append errors
+                    if "FileNotFoundError" in str(append_error) or "chunks" in str(append_error):
+                        self.logger.error("Dataset corruption detected during append", error=str(append_error))
+                        raise StorageException(f"Dataset corruption detected: {str(append_error)}", "dataset_append")
+                    failed_count += len(pending_rows)
+                    for vector, _ in pending_rows:
+                        error_messages.append(f"Vector {vector.id or 'unknown'}: {str(append_error)}")
+                    self.logger.warning("Failed to append vectors", dataset_id=dataset_id, count=len(pending_rows), error=str(append_error))
+            
             # Commit changes (with retry for concurrent access)
             loop = asyncio.get_event_loop()
             max_retries = 5
@@ -509,6 +536,9 @@ class DeepLakeService(LoggingMixin):
             # Use search options metric override if provided
             metric_type = options.metric_type or dataset_metric
             
+            # Unit-length rows let cosine scoring skip the per-row norms
+            unit_rows = dataset_info.get('normalize_vectors', False) and metric_type.lower() == 'cosine'
+            
             # Get index type and search parameters
             index_type_str = dataset_info.get('index_type', 'default')
             try:
@@ -528,7 +558,9 @@ class DeepLakeService(LoggingMixin):
             # Build search query based on metric type
             # Note: Deep Lake may not support all distance functions in SQL queries
             # We'll use a simple approach that gets all results and then sort/filter in Python
-            search_query = f"SELECT * LIMIT {options.top_k * 10}"  # Get more results to sort later
+            # Every row is a candidate: a LIMIT here would only keep the first rows
+            # in storage order, not the nearest ones
+            search_query = "SELECT *"
             
             # Use Deep Lake's search functionality (4.0 API)
             self.logger.info(f"Executing search query: {search_query}")
@@ -539,176 +571,14 @@ class DeepLakeService(LoggingMixin):
             )
             self.logger.info(f"Search returned {len(search_results)} raw results")
             
-            # Process results and calculate similarities
-            candidates = []
-            self.logger.info(f"Processing {len(search_results)} search results")
-            for i, result in enumerate(search_results):
-                try:
-                    self.logger.debug(f"Processing result {i}: {result}")
-                    # DeepLake 4.0 returns RowView objects, not dictionaries
-                    # Extract embedding values
-                    embedding_values = []
-                    try:
-                        embedding_data = result['embedding']
-                        if hasattr(embedding_data, 'tolist'):
-                            embedding_values = embedding_data.tolist()
-                        elif hasattr(embedding_data, '__iter__'):
-                            embedding_values = list(embedding_data)
-                        else:
-                            embedding_values = []
-                    except Exception as e:
-                        self.logger.warning(f"Failed to extract embedding: {e}")
-                        embedding_values = []
-                    
-                    # Extract fields using string keys for RowView
-                    try:
-                        result_id = result['id']
-                    except:
-                        result_id = ''
-                    
-                    try:
-                        result_document_id = result['document_id']
-                    except:
-                        result_document_id = ''
-                    
-                    try:
-                        result_content = result['content']
-                    except:
-                        result_content = ''
-                    
-                    try:
-                        result_chunk_id = result['chunk_id']
-                    except:
-                        result_chunk_id = ''
-                    
-                    try:
-                        result_metadata_json = result['metadata']
-                        # Parse JSON metadata
-                        import json
-                        result_metadata = json.loads(result_metadata_json) if result_metadata_json else {}
-                    except:
-                        result_metadata = {}
-                    
-                    try:
-                        result_content_hash = result['content_hash']
-                    except:
-                        result_content_hash = ''
-                    
-                    try:
-                        result_content_type = result['content_type']
-                    except:
-                        result_content_type = ''
-                    
-                    try:
-                        result_language = result['language']
-                    except:
-                        result_language = ''
-                    
-                    try:
-                        result_chunk_index = result['chunk_index']
-                    except:
-                        result_chunk_index = 0
-                    
-                    try:
-                        result_model = result['model']
-                    except:
-                        result_model = ''
-                    
-                    try:
-                        result_created_at = result['created_at']
-                    except:
-                        result_created_at = datetime.now(timezone.utc).isoformat()
-                    
-                    try:
-                        result_updated_at = result['updated_at']
-                    except:
-                        result_updated_at = datetime.now(timezone.utc).isoformat()
-                    
-                    try:
-                        result_chunk_count = result['chunk_count']
-                    except:
-                        result_chunk_count = 1
-                    
-                    vector_data = {
-                        'id': result_id,
-                        'document_id': result_document_id,
-                        'chunk_id': result_chunk_id,
-                        'values': embedding_values,
-                        'content': result_content,
-                        'metadata': result_metadata,
-                        'content_hash': result_content_hash,
-                        'content_type': result_content_type,
-                        'language': result_language,
-                        'chunk_index': result_chunk_index,
-                        'chunk_count': result_chunk_count,
-                        'model': result_model,
-                        'created_at': result_created_at,
-                        'updated_at': result_updated_at,
-                    }
-                    
-                    
-                    # Calculate similarity score based on metric type
-                    vector_values = np.array(vector_data['values'])
-                    
-                    if metric_type.lower() == 'cosine':
-                        # Calculate cosine similarity
-                        dot_product = np.dot(query_embedding, vector_values)
-                        query_norm = np.linalg.norm(query_embedding)
-                        vector_norm = np.linalg.norm(vector_values)
-                        
-                        if query_norm == 0 or vector_norm == 0:
-                            score = 0.0
-                            distance = 1.0
-                        else:
-                            score = dot_product / (query_norm * vector_norm)
-                            distance = 1.0 - score  # Convert similarity to distance
-                    else:  # L2 or euclidean
-                        # Calculate L2 distance
-                        distance = np.linalg.norm(query_embedding - vector_values)
-                        score = 1.0 / (1.0 + distance) if distance > 0 else 1.0
-                    
-                    vector_response = VectorResponse(
-                        id=vector_data['id'],
-                        dataset_id=dataset_id,
-                        document_id=vector_data['document_id'],
-                        chunk_id=vector_data['chunk_id'],
-                        values=vector_data['values'],
-                        content=vector_data['content'] if options.include_content else None,
-                        content_hash=vector_data['content_hash'],
-                        metadata=vector_data['metadata'] if options.include_metadata else {},
-                        content_type=vector_data['content_type'],
-                        language=vector_data['language'],
-                        chunk_index=vector_data['chunk_index'],
-                        chunk_count=vector_data['chunk_count'],
-                        model=vector_data['model'],
-                        dimensions=len(vector_data['values']),
-                        created_at=vector_data['created_at'],
-                        updated_at=vector_data['updated_at'],
-                        tenant_id=tenant_id
-                    )
-                    
-                    # Store candidate with score for sorting
-                    candidates.append({
-                        'vector_response': vector_response,
-                        'score': float(score),
-                        'distance': float(distance),
-                        'original_index': i
-                    })
-                    
-                except Exception as e:
-                    self.logger.warning("Failed to process search result", index=i, error=str(e))
-                    continue
-            
-            # Sort candidates by score (descending for similarities, ascending for distances)
-            if metric_type.lower() == 'cosine':
-                # For cosine similarity, higher scores are better
-                candidates.sort(key=lambda x: x['score'], reverse=True)
-            else:
-                # For L2 distance, lower distances are better (but we use score which is inverse)
-                candidates.sort(key=lambda x: x['score'], reverse=True)
+            # Score every candidate from the embedding column, one cache-sized block at a time
+            scores, distances = await loop.run_in_executor(
+                self.executor,
+                lambda: self._score_column(search_results, 'embedding', expected_dimensions, query_embedding, metric_type, unit_rows)
+            )
             
-            # Apply filtering and create final results
-            results = []
+            # Higher scores are better for every metric (L2 distances are inverted into scores)
+            order = np.argsort(-scores, kind='stable')
             
             # Parse metadata filters if provided
             metadata_filter_expr = None
@@ -721,22 +591,37 @@ class DeepLakeService(LoggingMixin):
                     self.logger.error("Failed to parse metadata filter", error=str(e))
                     raise InvalidSearchParametersException(f"Invalid metadata filter: {e}")
             
-            for i, candidate in enumerate(candidates):
-                score = candidate['score']
-                distance = candidate['distance']
-                vector_response = candidate['vector_response']
+            # Walk candidates best-first; rows are only materialized once they pass the score filters.
+            # Scores only fall and distances only grow along this order, so the first candidate
+            # that fails a score filter ends the walk.
+            results = []
+            for i in order:
+                # Stop if we have enough results
+                if len(results) >= options.top_k:
+                    break
+                
+                score = float(scores[i])
+                distance = float(distances[i])
                 
                 # Apply threshold filtering if specified
                 if options.threshold is not None:
                     if score < options.threshold:
-                        continue
+                        break
                 
                 # Apply min_score filtering if specified
                 if options.min_score is not None and score < options.min_score:
-                    continue
+                    break
                 
                 # Apply max_distance filtering if specified  
                 if options.max_distance is not None and distance > options.max_distance:
+                    break
+                
+                try:
+                    vector_response = self._search_row_to_vector(
+                        search_results[int(i)], dataset_id, options, tenant_id
+                    )
+                except Exception as e:
+                    self.logger.warning("Failed to process search result", index=int(i), error=str(e))
                     continue
                 
                 # Apply metadata filtering if specified
@@ -748,10 +633,6 @@ class DeepLakeService(LoggingMixin):
                         self.logger.warning("Failed to apply metadata filter", error=str(e), metadata=vector_response.metadata)
                         continue
                 
-                # Stop if we have enough results
-                if len(results) >= options.top_k:
-                    break
-                
                 results.append(SearchResultItem(
                     vector=vector_response,
                     score=score,
@@ -759,7 +640,7 @@ class DeepLakeService(LoggingMixin):
                     rank=len(results) + 1
                 ))
             
-            self.logger.info(f"Filtered to {len(results)} final results from {len(candidates)} candidates")
+            self.logger.info(f"Filtered to {len(results)} final results from {len(order)} candidates")
             
             query_time = (time.time() - start_time) * 1000
             
@@ -884,10 +765,12 @@ class DeepLakeService(LoggingMixin):
             
             # Update vector data
             current_time = datetime.now(timezone.utc).isoformat()
+            dataset_info = await self._load_dataset_metadata(dataset_path)
+            normalize = dataset_info.get('normalize_vectors', False)
             
             await loop.run_in_executor(
                 self.executor,
-                lambda: self._update_vector_at_index(dataset, vector_index, vector_update, current_time)
+                lambda: self._update_vector_at_index(dataset, vector_index, vector_update, current_time, normalize)
             )
             
             # Return updated vector
@@ -1054,12 +937,12 @@ class DeepLakeService(LoggingMixin):
             self.logger.error("Failed to get vector data by index", index=index, error=str(e))
             raise
     
-    def _update_vector_at_index(self, dataset: Any, index: int, vector_update: VectorUpdate, current_time: str) -> None:
+    def _update_vector_at_index(self, dataset: Any, index: int, vector_update: VectorUpdate, current_time: str, normalize: bool = False) -> None:
         """Update vector data at specific index."""
         try:
             # Update only provided fields
             if vector_update.values is not None:
-                dataset.embedding[index] = np.array(vector_update.values, dtype=np.float32)
+                dataset.embedding[index] = self._embedding_array(vector_update.values, normalize)
             
             if vector_update.content is not None:
                 dataset.content[index] = vector_update.content
@@ -1115,6 +998,257 @@ class DeepLakeService(LoggingMixin):
             self.logger.error("Failed to delete vector at index", index=index, error=str(e))
             raise
     
+    @staticmethod
+    def _embedding_array(values: Any, normalize: bool) -> np.ndarray:
+        """Convert vector values to a float32 array, scaled to unit length if ``normalize``.
+        
+        Zero vectors have no direction and are stored unchanged.
+        """
+        embedding = np.array(values, dtype=np.float32)
+        if normalize:
+            norm = np.linalg.norm(embedding)
+            if norm:
+                embedding /= norm
+        return embedding
+    
+    @staticmethod
+    def _column_matrix(view: Any, column: str, dimensions: int, start: int, stop: int) -> np.ndarray:
+        """Read rows ``[start, stop)`` of an embedding column as a contiguous float32 matrix.
+        
+        The rows are copied: Deep Lake exposes them with an explicit ``=f`` buffer
+        format, which SIMD kernels such as SimSIMD reject.
+        """
+        if stop <= start:
+            return np.empty((0, dimensions), dtype=np.float32)
+        return np.array(view[column][start:stop], dtype=np.float32, order='C').reshape(stop - start, dimensions)
+    
+    def _score_column(
+        self,
+        view: Any,
+        column: str,
+        dimensions: int,
+        query: np.ndarray,
+        metric_type: str,
+        normalized: bool = False
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Score ``query`` against every row of an embedding column.
+        
+        Rows are read and scored in blocks of about ``SEARCH_BLOCK_BYTES`` so each
+        block stays cache-resident across the scoring passes and the full
+        candidate matrix is never held in memory at once.
+        """
+        rows = len(view)
+        block_rows = max(1, self.SEARCH_BLOCK_BYTES // (4 * max(dimensions, 1)))
+        scores = np.empty(rows, dtype=np.float32)
+        distances = np.empty(rows, dtype=np.float32)
+        for start in range(0, rows, block_rows):
+            stop = min(start + block_rows, rows)
+            block = self._column_matrix(view, column, dimensions, start, stop)
+            scores[start:stop], distances[start:stop] = self._score_candidates(query, block, metric_type, normalized)
+        return scores, distances
+    
+    @staticmethod
+    def _score_candidates(
+        query: np.ndarray,
+        candidates: np.ndarray,
+        metric_type: str,
+        normalized: bool = False
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Score a query against every candidate row, returning ``(scores, distances)``.
+        
+        Cosine scores are similarities (distance ``1 - score``); any other metric
+        is scored as L2 distance with ``score = 1 / (1 + distance)``. Cosine
+        scores the rows against the unit query and takes row norms in float64,
+        so large-magnitude vectors do not overflow float32.
+        
+        When the optional ``simsimd`` package is installed its SIMD kernels are
+        used instead of NumPy. With ``normalized`` (unit-length candidates) cosine
+        is a single matrix-vector product over the rows and no row norms are computed.
+        """
+        is_cosine = metric_type.lower() == 'cosine'
+        if is_cosine and normalized:
+            unit_query = DeepLakeService._unit_query(query)
+            if unit_query is None:
+                return np.zeros(len(candidates), dtype=np.float32), np.ones(len(candidates), dtype=np.float32)
+            scores = candidates @ unit_query
+            return scores, 1.0 - scores
+        
+        if HAS_SIMSIMD and len(candidates):
+            return DeepLakeService._score_candidates_simsimd(query, candidates, metric_type)
+        
+        if is_cosine:
+            unit_query = DeepLakeService._unit_query(query)
+            if unit_query is None:
+                return np.zeros(len(candidates), dtype=np.float32), np.ones(len(candidates), dtype=np.float32)
+            dots = candidates @ unit_query
+            row_norms = np.sqrt(np.einsum('ij,ij->i', candidates, candidates, dtype=np.float64))
+            scores = np.zeros(len(candidates), dtype=np.float32)
+            np.divide(dots, row_norms, out=scores, where=row_norms != 0, casting='same_kind')
+            distances = np.where(row_norms != 0, 1.0 - scores, np.float32(1.0))
+        else:
+            distances = np.linalg.norm(candidates - query, axis=1)
+            scores = 1.0 / (1.0 + distances)
+        return scores, distances
+    
+    @staticmethod
+    def _unit_query(query: np.ndarray) -> Optional[np.ndarray]:
+        """Scale ``query`` to unit length, or return ``None`` for a zero vector.
+        
+        The norm is taken in float64 so float32 queries of any magnitude scale
+        without overflow.
+        """
+        query_norm = float(np.linalg.norm(query.astype(np.float64)))
+        if not query_norm:
+            return None
+        return (query / query_norm).astype(np.float32, copy=False)
+    
+    @staticmethod
+    def _score_candidates_simsimd(
+        query: np.ndarray,
+        candidates: np.ndarray,
+        metric_type: str
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """SimSIMD variant of ``_score_candidates`` with the same score semantics."""
+        if metric_type.lower() == 'cosine':
+            distances = np.asarray(
+                simsimd.cdist(query[np.newaxis, :], candidates, metric='cosine'), dtype=np.float32
+            ).reshape(-1)
+            # Zero vectors have no direction: score 0 at distance 1, as in the NumPy path
+            if not query.any():
+                distances[:] = 1.0
+            else:
+                distances[~candidates.any(axis=1)] = 1.0
+            scores = 1.0 - distances
+        else:
+            sq_distances = np.asarray(
+                simsimd.cdist(query[np.newaxis, :], candidates, metric='sqeuclidean'), dtype=np.float32
+            ).reshape(-1)
+            distances = np.sqrt(np.maximum(sq_distances, 0.0))
+            scores = 1.0 / (1.0 + distances)
+        return scores, distances
+    
+    def _search_row_to_vector(
+        self,
+        result: Any,
+        dataset_id: str,
+        options: SearchOptions,
+        tenant_id: Optional[str]
+    ) -> VectorResponse:
+        """Build the vector response for one search result row."""
+        # DeepLake 4.0 returns RowView objects, not dictionaries
+        try:
+            values = np.asarray(result['embedding'], dtype=np.float32).tolist()
+        except Exception as e:
+            self.logger.warning(f"Failed to extract embedding: {e}")
+            values = []
+        
+        # Extract fields using string keys for RowView
+        try:
+            result_id = result['id']
+        except:
+            result_id = ''
+        
+        try:
+            result_document_id = result['document_id']
+        except:
+            result_document_id = ''
+        
+        try:
+            result_content = result['content']
+        except:
+            result_content = ''
+        
+        try:
+            result_chunk_id = result['chunk_id']
+        except:
+            result_chunk_id = ''
+        
+        try:
+            result_metadata_json = result['metadata']
+            # Parse JSON metadata
+            import json
+            result_metadata = json.loads(result_metadata_json) if result_metadata_json else {}
+        except:
+            result_metadata = {}
+        
+        try:
+            result_content_hash = result['content_hash']
+        except:
+            result_content_hash = ''
+        
+        try:
+            result_content_type = result['content_type']
+        except:
+            result_content_type = ''
+        
+        try:
+            result_language = result['language']
+        except:
+            result_language = ''
+        
+        try:
+            result_chunk_index = result['chunk_index']
+        except:
+            result_chunk_index = 0
+        
+        try:
+            result_model = result['model']
+        except:
+            result_model = ''
+        
+        try:
+            result_created_at = result['created_at']
+        except:
+            result_created_at = datetime.now(timezone.utc).isoformat()
+        
+        try:
+            result_updated_at = result['updated_at']
+        except:
+            result_updated_at = datetime.now(timezone.utc).isoformat()
+        
+        try:
+            result_chunk_count = result['chunk_count']
+        except:
+            result_chunk_count = 1
+        
+        
+        vector_data = {
+            'id': result_id,
+            'document_id': result_document_id,
+            'chunk_id': result_chunk_id,
+            'values': values,
+            'content': result_content,
+            'metadata': result_metadata,
+            'content_hash': result_content_hash,
+            'content_type': result_content_type,
+            'language': result_language,
+            'chunk_index': result_chunk_index,
+            'chunk_count': result_chunk_count,
+            'model': result_model,
+            'created_at': result_created_at,
+            'updated_at': result_updated_at,
+        }
+        
+        return VectorResponse(
+            id=vector_data['id'],
+            dataset_id=dataset_id,
+            document_id=vector_data['document_id'],
+            chunk_id=vector_data['chunk_id'],
+            values=vector_data['values'],
+            content=vector_data['content'] if options.include_content else None,
+            content_hash=vector_data['content_hash'],
+            metadata=vector_data['metadata'] if options.include_metadata else {},
+            content_type=vector_data['content_type'],
+            language=vector_data['language'],
+            chunk_index=vector_data['chunk_index'],
+            chunk_count=vector_data['chunk_count'],
+            model=vector_data['model'],
+            dimensions=len(vector_data['values']),
+            created_at=vector_data['created_at'],
+            updated_at=vector_data['updated_at'],
+            tenant_id=tenant_id
+        )
+    
     def _vector_exists(self, dataset: Any, vector_id: str) -> bool:
         """Check if a vector exists in the dataset."""
         try:
@@ -2,12 +2,16 @@
 
 import os
 import asyncio
+import importlib.util
 from typing import List, Optional, Dict, Any
 from abc import ABC, abstractmethod
 import structlog
 
 logger = structlog.get_logger(__name__)
 
+# Probed once at import so requests never repeat the package lookup
+SENTENCE_TRANSFORMERS_AVAILABLE = importlib.util.find_spec("sentence_transformers") is not None
+
 
 class EmbeddingProvider(ABC):
     """Abstract base class for embedding providers."""
@@ -103,10 +107,20 @@ class SentenceTransformersProvider(EmbeddingProvider):
         self.model_name = model_name
         self._model = None
         self._dimensions = None
+        self._import_error: Optional[RuntimeError] = None
     
     async def _load_model(self):
         """Load the sentence transformer model."""
+        if self._import_error is not None:
+            # A missing package will not appear until restart; other load failures are retried
+            raise self._import_error
         if self._model is None:
+            if not SENTENCE_TRANSFORMERS_AVAILABLE:
+                self._import_error = RuntimeError(
+                    "sentence-transformers library not installed. "
+                    "Install with: pip install sentence-transformers"
+                )
+                raise self._import_error
             try:
                 from sentence_transformers import SentenceTransformer
                 
@@ -127,10 +141,11 @@ class SentenceTransformersProvider(EmbeddingProvider):
                 
             except ImportError as e:
                 logger.error("sentence-transformers not installed", error=str(e))
-                raise RuntimeError(
+                self._import_error = RuntimeError(
                     "sentence-transformers library not installed. "
                     "Install with: pip install sentence-transformers"
                 )
+                raise self._import_error
             except Exception as e:
                 logger.error("Failed to load sentence transformer model", error=str(e), model=self.model_name)
                 raise RuntimeError(
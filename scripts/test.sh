@@ -89,6 +89,19 @@ case "${1:-all}" in
     "fast")
         run_tests "fast" "not slow and not monitoring" "Fast Tests (excluding slow and monitoring tests)"
         ;;
+    "parallel")
+        print_header "Parallel Tests (pytest-xdist, excluding monitoring tests)"
+        pytest tests/ \
+            -m "not monitoring" \
+            -n "${PYTEST_WORKERS:-auto}" \
+            --dist=loadgroup \
+            --cov=app \
+            --cov-report=term-missing \
+            --cov-report=html:htmlcov \
+            --cov-report=xml:coverage.xml \
+            --cov-fail-under=25 \
+            --tb=short
+        ;;
     "comprehensive")
         print_header "Comprehensive API Tests"
         pytest tests/integration/test_api_comprehensive.py -v --tb=short
@@ -117,6 +130,7 @@ case "${1:-all}" in
         echo "  integration   - Run integration tests only"
         echo "  monitoring    - Run monitoring/alerting tests (requires monitoring stack)"
         echo "  fast          - Run fast tests (exclude slow and monitoring tests)"
+        echo "  parallel      - Run all non-monitoring tests across pytest-xdist workers"
         echo "  comprehensive - Run comprehensive API tests (converted from curl_examples.sh)"
         echo "  coverage      - Run all tests with detailed coverage report"
         echo "  help          - Show this help message"
@@ -125,10 +139,12 @@ case "${1:-all}" in
         echo "  ./scripts/test.sh                    # Run all tests"
         echo "  ./scripts/test.sh unit              # Unit tests only"
         echo "  ./scripts/test.sh fast              # Fast tests for development"
+        echo "  ./scripts/test.sh parallel          # Spread tests across all CPUs"
         echo "  ./scripts/test.sh comprehensive     # Full API workflow tests"
         echo
         echo "Environment Variables:"
         echo "  PYTEST_ARGS - Additional pytest arguments"
+        echo "  PYTEST_WORKERS - Worker count for the parallel run (default: auto)"
         echo "  TEST_VERBOSE - Set to '1' for verbose output"
         ;;
     "all"|*)
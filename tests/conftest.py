@@ -1,15 +1,25 @@
 """Test configuration and fixtures."""
 
 import os
+import socket
 import tempfile
 import shutil
 import asyncio
+import uuid
 from typing import AsyncGenerator, Generator
 import pytest
+import pytest_asyncio
+from fastapi import FastAPI
 from fastapi.testclient import TestClient
+from httpx import ASGITransport, AsyncClient
+from starlette.requests import Request
 
 # Set test environment variables before importing app modules
-os.environ["DEEPLAKE_STORAGE_LOCATION"] = tempfile.mkdtemp()
+# Each pytest-xdist worker imports conftest separately and gets its own storage dir
+WORKER_ID = os.environ.get("PYTEST_XDIST_WORKER", "main")
+# Keep Deep Lake storage on tmpfs where available so commits never hit disk
+TMPFS_ROOT = "/dev/shm" if os.access("/dev/shm", os.W_OK) else None
+os.environ["DEEPLAKE_STORAGE_LOCATION"] = tempfile.mkdtemp(prefix=f"deeplake_{WORKER_ID}_", dir=TMPFS_ROOT)
 os.environ["JWT_SECRET_KEY"] = "test-secret-key"
 os.environ["REDIS_URL"] = "redis://localhost:6379/1"
 os.environ["DEV_DEBUG"] = "true"
@@ -22,7 +32,46 @@ from app.services.cache_service import CacheService
 from app.services.metrics_service import MetricsService
 from app.services.rate_limit_service import RateLimitService
 from app.services.backup_service import BackupService
-from app.api.http.dependencies import init_dependencies
+from app.api.http.dependencies import init_dependencies, get_current_auth
+import app.api.http.dependencies as deps
+from app.models.schemas import DatasetCreate
+from tests.fixtures.monitoring import MONITORING_ENDPOINTS
+
+service_availability_key = pytest.StashKey[dict]()
+
+
+def _is_port_open(host: str, port: int, timeout: float = 0.5) -> bool:
+    """Check whether a TCP port accepts connections."""
+    try:
+        with socket.create_connection((host, port), timeout=timeout):
+            return True
+    except OSError:
+        return False
+
+
+def pytest_unconfigure(config):
+    """Remove the app-level storage dir created at import; tmpfs is RAM."""
+    shutil.rmtree(os.environ["DEEPLAKE_STORAGE_LOCATION"], ignore_errors=True)
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip tests whose monitoring services are unreachable.
+
+    Each service is probed at most once per session, so a missing
+    monitoring stack costs one short TCP connect instead of a request
+    timeout in every test.
+    """
+    availability = config.stash.setdefault(service_availability_key, {})
+    for item in items:
+        for marker in item.iter_markers("requires_service"):
+            name = marker.args[0]
+            host, port = MONITORING_ENDPOINTS[name]
+            if name not in availability:
+                availability[name] = _is_port_open(host, port)
+            if not availability[name]:
+                item.add_marker(pytest.mark.skip(
+                    reason=f"{name} not reachable at {host}:{port} - monitoring infrastructure may not be running"
+                ))
 
 
 @pytest.fixture(scope="session")
@@ -36,43 +85,102 @@ def event_loop():
 @pytest.fixture(scope="function")
 def temp_storage() -> Generator[str, None, None]:
     """Create a temporary storage directory for tests."""
-    temp_dir = tempfile.mkdtemp(prefix='deeplake_test_')
+    temp_dir = tempfile.mkdtemp(prefix=f'deeplake_test_{WORKER_ID}_', dir=TMPFS_ROOT)
     yield temp_dir
     # Clean up
     if os.path.exists(temp_dir):
         shutil.rmtree(temp_dir, ignore_errors=True)
 
 
-@pytest.fixture(scope="function")
-async def deeplake_service(temp_storage: str) -> AsyncGenerator[DeepLakeService, None]:
-    """Create a Deep Lake service instance for testing."""
-    # Override storage location
-    original_location = os.environ.get("DEEPLAKE_STORAGE_LOCATION")
-    os.environ["DEEPLAKE_STORAGE_LOCATION"] = temp_storage
-    
-    service = DeepLakeService()
-    try:
-        yield service
-    finally:
-        # Clean up service state
-        await service.close()
-        # Clear any cached datasets
-        if hasattr(service, 'datasets'):
-            service.datasets.clear()
-        
-        # Restore original location
-        if original_location:
-            os.environ["DEEPLAKE_STORAGE_LOCATION"] = original_location
-        else:
-            os.environ.pop("DEEPLAKE_STORAGE_LOCATION", None)
+@pytest.fixture(scope="session")
+def dl_root(tmp_path_factory: pytest.TempPathFactory) -> Generator[str, None, None]:
+    """Session storage root for Deep Lake, on tmpfs when the host has one.
 
+    ``DeepLakeService`` resolves dataset paths with ``os.path``, so an
+    in-memory ``mem://`` root is not an option; ``/dev/shm`` gives the same
+    effect for commits without changing the service.
+    """
+    if TMPFS_ROOT is None:
+        yield str(tmp_path_factory.mktemp(f"deeplake_{WORKER_ID}"))
+        return
+    root = tempfile.mkdtemp(prefix=f"deeplake_{WORKER_ID}_", dir=TMPFS_ROOT)
+    yield root
+    shutil.rmtree(root, ignore_errors=True)
 
-@pytest.fixture(scope="function")
+
+@pytest.fixture(scope="session")
+def deeplake_service(dl_root: str) -> Generator[DeepLakeService, None, None]:
+    """Create a Deep Lake service instance shared across the test session.
+
+    Tests isolate their data by tenant (see ``tenant_id``) instead of paying
+    for a new service each time. The storage root is namespaced by xdist
+    worker, so parallel workers never share dataset paths.
+    """
+    service = DeepLakeService(storage_location=dl_root)
+    yield service
+    asyncio.run(service.close())
+    service.datasets.clear()
+
+
+@pytest.fixture
+def tenant_id(request: pytest.FixtureRequest) -> str:
+    """Tenant ID unique to the requesting test."""
+    return request.node.name.replace("[", "_").replace("]", "_")
+
+
+@pytest.fixture(scope="session")
 def auth_service() -> AuthService:
-    """Create an auth service instance for testing."""
+    """Create an auth service instance shared across the test session."""
     return AuthService()
 
 
+@pytest.fixture(scope="session")
+def api_key(auth_service: AuthService) -> str:
+    """API key for the default tenant with full permissions."""
+    return auth_service.generate_api_key(
+        tenant_id="default",
+        name="Test API Key",
+        permissions=["read", "write", "admin"]
+    )
+
+
+@pytest.fixture(scope="session")
+def jwt_token(auth_service: AuthService) -> str:
+    """JWT token for the default tenant with full permissions."""
+    payload = {
+        "tenant_id": "default",
+        "user_id": "test-user",
+        "permissions": ["read", "write", "admin"]
+    }
+    return auth_service.create_jwt_token(payload)
+
+
+def _create_tenant_key(auth_service: AuthService, tenant_id: str, name: str) -> str:
+    """Create a tenant and return a read/write API key for it."""
+    auth_service.create_tenant(
+        tenant_id=tenant_id,
+        name=name,
+        permissions=["read", "write", "admin"]
+    )
+    return auth_service.generate_api_key(
+        tenant_id=tenant_id,
+        name=f"{name} Key",
+        permissions=["read", "write"]
+    )
+
+
+@pytest.fixture(scope="session")
+def tenant1_key(auth_service: AuthService) -> str:
+    """API key for the isolated ``tenant1`` tenant."""
+    return _create_tenant_key(auth_service, "tenant1", "Tenant 1")
+
+
+@pytest.fixture(scope="session")
+def tenant2_key(auth_service: AuthService) -> str:
+    """API key for the isolated ``tenant2`` tenant."""
+    return _create_tenant_key(auth_service, "tenant2", "Tenant 2")
+
+
 @pytest.fixture(scope="function")
 async def cache_service() -> AsyncGenerator[CacheService, None]:
     """Create a cache service instance for testing."""
@@ -122,30 +230,31 @@ async def test_services(
     return deeplake_service, auth_service, cache_service, metrics_service, rate_limit_service, backup_service
 
 
-@pytest.fixture(scope="function")
-async def client(test_services) -> TestClient:
-    """Create a test client for the FastAPI app."""
+def _build_test_app(test_services: tuple, middleware: bool = True) -> FastAPI:
+    """Build a copy of the FastAPI app wired to the given test services.
+
+    With ``middleware=False`` the CORS, rate limiting and request
+    timing/metrics middleware are left out.
+    """
     # The test_services fixture already initializes dependencies
     # Create a new FastAPI app instance without lifespan to avoid startup conflicts
-    from fastapi import FastAPI
-    from app.main import app as original_app
-    
     # Create a test app without lifespan
     test_app = FastAPI(
-        title=original_app.title,
-        description=original_app.description,
-        version=original_app.version,
+        title=app.title,
+        description=app.description,
+        version=app.version,
         docs_url="/docs",
         redoc_url="/redoc",
     )
     
     # Copy all routes from the original app
-    for route in original_app.routes:
+    for route in app.routes:
         test_app.routes.append(route)
     
     # Copy middleware
-    test_app.user_middleware = original_app.user_middleware[:]
-    test_app.middleware_stack = original_app.middleware_stack
+    if middleware:
+        test_app.user_middleware = app.user_middleware[:]
+        test_app.middleware_stack = app.middleware_stack
     
     # Set up the app state with test services
     test_app.state.deeplake_service = test_services[0]
@@ -155,7 +264,79 @@ async def client(test_services) -> TestClient:
     test_app.state.rate_limit_service = test_services[4]
     test_app.state.backup_service = test_services[5]
     
-    with TestClient(test_app) as test_client:
+    return test_app
+
+
+@pytest.fixture(scope="function")
+async def async_client(test_services) -> AsyncGenerator[AsyncClient, None]:
+    """Create an async client that drives the FastAPI app in-process.
+
+    Requests go straight to the ASGI app on the test's event loop, so
+    concurrent requests can be issued with ``asyncio.gather`` without
+    spawning threads.
+    """
+    transport = ASGITransport(app=_build_test_app(test_services))
+    async with AsyncClient(transport=transport, base_url="http://testserver", timeout=None) as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="session")
+def session_services(deeplake_service: DeepLakeService, auth_service: AuthService) -> tuple:
+    """Initialize a set of services shared across the test session.
+
+    For tests that don't need per-test service state, e.g. health probes or
+    inserts into session-scoped datasets.
+    """
+    cache_service = CacheService()
+    cache_service.enabled = False
+    rate_limit_service = RateLimitService()
+    rate_limit_service.enabled = False
+    services = (
+        deeplake_service,
+        auth_service,
+        cache_service,
+        MetricsService(),
+        rate_limit_service,
+        BackupService(deeplake_service=deeplake_service),
+    )
+    init_dependencies(*services)
+    return services
+
+
+@pytest.fixture(scope="session")
+def client(session_services: tuple) -> Generator[TestClient, None, None]:
+    """Create a full-stack test client shared across the test session.
+
+    The app and its services are built once; tests that create datasets
+    use unique names or ``overwrite`` so they never depend on each other.
+    """
+    with TestClient(_build_test_app(session_services)) as test_client:
+        yield test_client
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def aclient(session_services: tuple) -> AsyncGenerator[AsyncClient, None]:
+    """Create an async client wired to the session-wide services.
+
+    The client and its ASGI transport live on the session event loop, so
+    tests marked ``pytest.mark.asyncio(loop_scope="session")`` reuse one
+    loop and skip TestClient's per-request thread portal.
+    """
+    transport = ASGITransport(app=_build_test_app(session_services))
+    async with AsyncClient(transport=transport, base_url="http://testserver", timeout=None) as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="session")
+def bare_client(session_services: tuple) -> Generator[TestClient, None, None]:
+    """Create a session-wide test client without the middleware stack.
+
+    For read-only probes such as health checks. Server errors come back as
+    500 responses instead of being raised. Tests that observe metrics or
+    request headers should use ``client``.
+    """
+    test_app = _build_test_app(session_services, middleware=False)
+    with TestClient(test_app, raise_server_exceptions=False) as test_client:
         yield test_client
 
 
@@ -163,7 +344,6 @@ async def client(test_services) -> TestClient:
 def cleanup_global_state():
     """Clean up global state before and after each test."""
     # Before test: store original global state
-    import app.api.http.dependencies as deps
     original_state = {
         '_deeplake_service': getattr(deps, '_deeplake_service', None),
         '_auth_service': getattr(deps, '_auth_service', None),
@@ -184,7 +364,6 @@ def cleanup_global_state():
 @pytest.fixture
 def test_dataset_data():
     """Sample dataset data for testing."""
-    import uuid
     unique_name = f"test-dataset-{uuid.uuid4().hex[:8]}"
     return {
         "name": unique_name,
@@ -197,6 +376,16 @@ def test_dataset_data():
     }
 
 
+@pytest.fixture
+def dataset_create(test_dataset_data):
+    """Validated ``DatasetCreate`` built once from ``test_dataset_data``.
+
+    Tests that need a variant should use ``model_copy(update=...)`` rather
+    than mutating or re-validating the model.
+    """
+    return DatasetCreate(**test_dataset_data)
+
+
 @pytest.fixture
 def test_vector_data():
     """Sample vector data for testing."""
@@ -229,39 +418,125 @@ def test_search_data():
 
 
 @pytest.fixture
-async def auth_headers(test_services):
+def insert_vectors(client: TestClient, auth_headers):
+    """Insert vectors through the batch endpoint in a single request.
+
+    Tests that only need data in place should use this rather than posting
+    vectors one at a time, so setup costs one round trip and one commit.
+    """
+    def _insert(dataset_id: str, vectors: list, **options):
+        return client.post(
+            f"/api/v1/datasets/{dataset_id}/vectors/batch",
+            json={"vectors": vectors, **options},
+            headers=auth_headers
+        )
+    return _insert
+
+
+@pytest.fixture(scope="session")
+def auth_headers(api_key: str):
     """Generate auth headers for testing."""
-    # Use the auth service from test_services to ensure consistency
-    auth_service = test_services[1]  # auth_service is the second item in the tuple
-    
-    # Create a test API key
-    api_key = auth_service.generate_api_key(
-        tenant_id="default",
-        name="Test API Key",
-        permissions=["read", "write", "admin"]
-    )
-    
     return {
         "Authorization": f"ApiKey {api_key}",
         "Content-Type": "application/json"
     }
 
 
-@pytest.fixture
-async def jwt_headers(test_services):
+@pytest.fixture(scope="session")
+def jwt_headers(jwt_token: str):
     """Generate JWT auth headers for testing."""
-    # Use the auth service from test_services to ensure consistency
-    auth_service = test_services[1]  # auth_service is the second item in the tuple
-    
-    # Create a test JWT token
-    payload = {
-        "tenant_id": "default",
-        "user_id": "test-user",
-        "permissions": ["read", "write", "admin"]
-    }
-    token = auth_service.create_jwt_token(payload)
-    
     return {
-        "Authorization": f"Bearer {token}",
+        "Authorization": f"Bearer {jwt_token}",
         "Content-Type": "application/json"
-    }
\ No newline at end of file
+    }
+
+
+@pytest.fixture(scope="session")
+def authenticate(auth_service: AuthService):
+    """Call ``get_current_auth`` directly with the given request headers.
+
+    Auth-negative tests use this instead of an HTTP round trip, so they can
+    assert the exact status code raised by the dependency.
+    """
+    async def _authenticate(headers: dict):
+        request = Request({
+            "type": "http",
+            "method": "GET",
+            "path": "/",
+            "headers": [(k.lower().encode(), v.encode()) for k, v in headers.items()],
+        })
+        return await get_current_auth(request, api_key=None, auth_service=auth_service)
+    return _authenticate
+
+
+@pytest.fixture(scope="session")
+def dataset_3d(client: TestClient, auth_headers) -> dict:
+    """3D cosine dataset shared by all insert test classes, created once per session.
+
+    Returns the dataset ``id`` with its single and batch insert endpoint
+    URLs (``url``, ``batch_url``) resolved up front. Tests that need to
+    find their own vectors again namespace the ids they insert (see
+    ``test_batch_insert_with_skip_existing``).
+    """
+    response = client.post(
+        "/api/v1/datasets/",
+        json={
+            "name": f"test-dataset-3d-{uuid.uuid4().hex[:8]}",
+            "description": "3D test dataset for vector insert tests",
+            "dimensions": 3,
+            "metric_type": "cosine",
+            "overwrite": True
+        },
+        headers=auth_headers
+    )
+    assert response.status_code == 201
+    dataset_id = response.json()["id"]
+    return {
+        "id": dataset_id,
+        "url": f"/api/v1/datasets/{dataset_id}/vectors/",
+        "batch_url": f"/api/v1/datasets/{dataset_id}/vectors/batch",
+    }
+
+
+@pytest.fixture(scope="session")
+def seeded_dataset(client: TestClient, auth_headers) -> Generator[str, None, None]:
+    """128D cosine dataset with a few vectors, created once per session.
+
+    Shared by every test in the session, so only read-only tests (search,
+    listing) may use it; tests that insert vectors create their own dataset.
+    Deleted on session teardown.
+    """
+    response = client.post(
+        "/api/v1/datasets/",
+        json={
+            "name": f"seeded-dataset-{uuid.uuid4().hex[:8]}",
+            "description": "Seeded 128D dataset for read-only API tests",
+            "dimensions": 128,
+            "metric_type": "cosine",
+            "overwrite": True
+        },
+        headers=auth_headers
+    )
+    assert response.status_code == 201
+    dataset_id = response.json()["id"]
+
+    response = client.post(
+        f"/api/v1/datasets/{dataset_id}/vectors/batch",
+        json={"vectors": [
+            {
+                "id": f"seeded-vector-{i}",
+                "document_id": f"seeded-doc-{i}",
+                "values": [0.1 + i * 0.01] * 128,
+                "content": f"Seeded content {i}",
+                "metadata": {"index": str(i)},
+                "chunk_count": 1
+            }
+            for i in range(4)
+        ]},
+        headers=auth_headers
+    )
+    assert response.status_code == 201
+
+    yield dataset_id
+
+    client.delete(f"/api/v1/datasets/{dataset_id}", headers=auth_headers)
@@ -0,0 +1,17 @@
+"""Monitoring stack endpoints shared by the monitoring tests."""
+
+from typing import Dict, Tuple
+
+
+# (host, port) of each monitoring service, probed by the ``requires_service`` marker
+MONITORING_ENDPOINTS: Dict[str, Tuple[str, int]] = {
+    "prometheus": ("localhost", 9090),
+    "alertmanager": ("localhost", 9093),
+    "grafana": ("localhost", 3000),
+}
+
+
+def monitoring_url(name: str) -> str:
+    """Base HTTP URL of the named monitoring service."""
+    host, port = MONITORING_ENDPOINTS[name]
+    return f"http://{host}:{port}"
@@ -6,6 +6,9 @@ tested with the curl_examples.sh script.
 
 import pytest
 import json
+import threading
+import time
+from fastapi import HTTPException
 from fastapi.testclient import TestClient
 from typing import Dict, Any, List
 
@@ -342,21 +345,19 @@ class TestAPIErrorHandling:
         error_data = response.json()
         assert "field required" in str(error_data).lower()
     
-    def test_unauthorized_access(self, client: TestClient):
+    async def test_unauthorized_access(self, authenticate):
         """Test accessing endpoints without authorization."""
-        response = client.get("/api/v1/datasets/")
-        # Should return 500 if no auth header, or 401 if invalid auth is detected
-        assert response.status_code in [401, 500]
+        with pytest.raises(HTTPException) as exc_info:
+            await authenticate({})
+        
+        assert exc_info.value.status_code == 401
     
-    def test_invalid_auth_token(self, client: TestClient, test_dataset: str):
+    async def test_invalid_auth_token(self, authenticate):
         """Test access with invalid authentication token."""
-        invalid_headers = {
-            "Authorization": "ApiKey invalid-token-12345",
-            "Content-Type": "application/json"
-        }
+        with pytest.raises(HTTPException) as exc_info:
+            await authenticate({"Authorization": "ApiKey invalid-token-12345"})
         
-        response = client.get("/api/v1/datasets/", headers=invalid_headers)
-        assert response.status_code == 401
+        assert exc_info.value.status_code == 401
 
 
 @pytest.mark.integration
@@ -507,7 +508,8 @@ class TestAPIPerformance:
     def test_search_performance(
         self, 
         client: TestClient, 
-        auth_headers: Dict[str, str]
+        auth_headers: Dict[str, str],
+        insert_vectors
     ):
         """Test search performance with reasonable response times."""
         # Create a small dataset for performance testing
@@ -536,12 +538,7 @@ class TestAPIPerformance:
                 "content": f"Performance test content {i}"
             })
         
-        batch_data = {"vectors": vectors}
-        batch_response = client.post(
-            f"/api/v1/datasets/{dataset_id}/vectors/batch",
-            json=batch_data,
-            headers=auth_headers
-        )
+        batch_response = insert_vectors(dataset_id, vectors)
         assert batch_response.status_code == 201
         
         # Perform search and check response time
@@ -572,9 +569,6 @@ class TestAPIPerformance:
         auth_headers: Dict[str, str]
     ):
         """Test handling of concurrent requests."""
-        import threading
-        import time
-        
         results = []
         
         def make_health_check():
@@ -0,0 +1,108 @@
+"""Integration tests for dataset distance metrics.
+
+Each supported metric gets one small dataset, created and seeded once per
+module; the tests only issue searches against it.
+"""
+
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient
+from typing import AsyncGenerator, Dict
+
+# Run every test on the session event loop shared with the ``aclient`` fixture
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+# Metrics accepted by DatasetCreate.metric_type
+METRIC_TYPES = ("cosine", "euclidean", "manhattan", "dot_product")
+
+METRIC_DIMENSIONS = 3
+
+# Reference vector stored in every metric dataset
+REFERENCE_VECTOR = [1.0, 1.0, 1.0]
+
+# (metric_type, query_vector, expected_score, expected_distance) against
+# REFERENCE_VECTOR. manhattan and dot_product are not listed because the
+# service currently scores every non-cosine metric as L2.
+METRIC_SEARCH_CASES = [
+    # Parallel query: identical direction
+    pytest.param("cosine", [2.0, 2.0, 2.0], 1.0, 0.0, id="cosine"),
+    # (4, 5, 1) - (1, 1, 1) = (3, 4, 0), so the distance is 5
+    pytest.param("euclidean", [4.0, 5.0, 1.0], 1.0 / 6.0, 5.0, id="euclidean"),
+]
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def metric_datasets(aclient: AsyncClient, auth_headers) -> AsyncGenerator[Dict[str, str], None]:
+    """Create one seeded dataset per metric type, shared by the module."""
+    datasets = {}
+    for metric_type in METRIC_TYPES:
+        response = await aclient.post(
+            "/api/v1/datasets/",
+            json={
+                "name": f"distance-metric-{metric_type}",
+                "dimensions": METRIC_DIMENSIONS,
+                "metric_type": metric_type,
+                "overwrite": True
+            },
+            headers=auth_headers
+        )
+        assert response.status_code == 201
+        dataset_id = response.json()["id"]
+
+        response = await aclient.post(
+            f"/api/v1/datasets/{dataset_id}/vectors/batch",
+            json={"vectors": [{
+                "id": f"reference-{metric_type}",
+                "document_id": "reference-doc",
+                "values": REFERENCE_VECTOR,
+                "chunk_count": 1
+            }]},
+            headers=auth_headers
+        )
+        assert response.status_code == 201
+        assert response.json()["inserted_count"] == 1
+        datasets[metric_type] = dataset_id
+
+    yield datasets
+
+    for dataset_id in datasets.values():
+        await aclient.delete(f"/api/v1/datasets/{dataset_id}", headers=auth_headers)
+
+
+@pytest.mark.integration
+@pytest.mark.xdist_group("metrics")
+class TestDistanceMetrics:
+    """Search scoring for each dataset metric type."""
+
+    @pytest.mark.parametrize("metric_type", METRIC_TYPES)
+    async def test_dataset_creation_with_metrics(self, aclient: AsyncClient, auth_headers, metric_datasets, metric_type):
+        """Test each metric type is stored on the dataset."""
+        response = await aclient.get(f"/api/v1/datasets/{metric_datasets[metric_type]}", headers=auth_headers)
+        assert response.status_code == 200
+        dataset = response.json()
+        assert dataset["metric_type"] == metric_type
+        assert dataset["dimensions"] == METRIC_DIMENSIONS
+
+    @pytest.mark.parametrize("metric_type,query_vector,expected_score,expected_distance", METRIC_SEARCH_CASES)
+    async def test_metric_search(
+        self,
+        aclient: AsyncClient,
+        auth_headers,
+        metric_datasets,
+        metric_type,
+        query_vector,
+        expected_score,
+        expected_distance
+    ):
+        """Test search scores the reference vector according to the dataset metric."""
+        response = await aclient.post(
+            f"/api/v1/datasets/{metric_datasets[metric_type]}/search",
+            json={"query_vector": query_vector, "options": {"top_k": 1}},
+            headers=auth_headers
+        )
+        assert response.status_code == 200
+        results = response.json()["results"]
+
+        assert len(results) == 1
+        assert results[0]["score"] == pytest.approx(expected_score, abs=1e-3)
+        assert results[0]["distance"] == pytest.approx(expected_distance, abs=1e-3)
@@ -2,14 +2,60 @@
 
 import pytest
 import asyncio
+import orjson
+from functools import lru_cache
 from fastapi.testclient import TestClient
 
+SEARCH_RESULT_KEYS = frozenset({"results", "total_found", "query_time_ms", "stats"})
+SERVICE_STATS_KEYS = frozenset({"service", "tenant"})
+
+# Constant search queries, built and encoded once per module
+_QUERY_128 = (0.1,) * 128
+_SEARCH_BODY_128 = orjson.dumps({
+    "query_vector": _QUERY_128,
+    "options": {
+        "top_k": 3,
+        "include_content": True,
+        "include_metadata": True
+    }
+})
+
+
+@lru_cache(maxsize=None)
+def _search_body(dim: int, top_k: int = 10) -> bytes:
+    """Encoded search body with a constant ``dim``-dimensional query."""
+    return orjson.dumps({"query_vector": (0.1,) * dim, "options": {"top_k": top_k}})
+
+
+@pytest.fixture(scope="module")
+def batch_payloads():
+    """Build batch insert bodies, encoding each ``(batch_size, dim)`` once per module."""
+    cache = {}
+
+    def build(batch_size: int, dim: int) -> bytes:
+        if (batch_size, dim) not in cache:
+            vectors = [
+                {
+                    "id": f"perf-vector-{i}",
+                    "document_id": f"perf-doc-{i}",
+                    "values": [0.1 + i * 0.001] * dim,
+                    "content": f"Performance test content {i}",
+                    "metadata": {"batch": "performance", "index": str(i)}
+                }
+                for i in range(batch_size)
+            ]
+            cache[(batch_size, dim)] = orjson.dumps({"vectors": vectors})
+        return cache[(batch_size, dim)]
+
+    return build
+
 
 @pytest.mark.integration
+@pytest.mark.xdist_group("e2e")
 class TestEndToEnd:
     """End-to-end integration tests."""
     
-    def test_complete_workflow(self, client: TestClient, auth_headers):
+    def test_complete_workflow(self, client: TestClient, auth_headers, insert_vectors):
         """Test complete workflow from dataset creation to search."""
         
         # 1. Create a dataset
@@ -55,12 +101,7 @@ class TestEndToEnd:
             }
             vectors.append(vector)
         
-        batch_data = {"vectors": vectors}
-        insert_response = client.post(
-            f"/api/v1/datasets/{dataset_id}/vectors/batch",
-            json=batch_data,
-            headers=auth_headers
-        )
+        insert_response = insert_vectors(dataset_id, vectors)
         assert insert_response.status_code == 201
         insert_result = insert_response.json()
         assert insert_result["inserted_count"] == 5
@@ -73,28 +114,16 @@ class TestEndToEnd:
         # Note: vector_count might not be immediately updated due to async nature
         
         # 5. Perform vector search
-        search_data = {
-            "query_vector": [0.1] * 128,
-            "options": {
-                "top_k": 3,
-                "include_content": True,
-                "include_metadata": True
-            }
-        }
-        
         search_response = client.post(
             f"/api/v1/datasets/{dataset_id}/search",
-            json=search_data,
-            headers=auth_headers
+            content=_SEARCH_BODY_128,
+            headers={**auth_headers, "Content-Type": "application/json"}
         )
         assert search_response.status_code == 200
         search_result = search_response.json()
         
         # Verify search results structure
-        assert "results" in search_result
-        assert "total_found" in search_result
-        assert "query_time_ms" in search_result
-        assert "stats" in search_result
+        assert SEARCH_RESULT_KEYS <= search_result.keys()
         
         # 6. List all datasets
         list_response = client.get("/api/v1/datasets/", headers=auth_headers)
@@ -106,8 +135,7 @@ class TestEndToEnd:
         stats_response = client.get("/api/v1/stats", headers=auth_headers)
         assert stats_response.status_code == 200
         service_stats = stats_response.json()
-        assert "service" in service_stats
-        assert "tenant" in service_stats
+        assert SERVICE_STATS_KEYS <= service_stats.keys()
         
         # 8. Clean up - delete dataset
         delete_response = client.delete(f"/api/v1/datasets/{dataset_id}", headers=auth_headers)
@@ -117,58 +145,27 @@ class TestEndToEnd:
         get_response = client.get(f"/api/v1/datasets/{dataset_id}", headers=auth_headers)
         assert get_response.status_code == 404
     
-    def test_error_scenarios(self, client: TestClient, auth_headers):
+    @pytest.mark.parametrize("method,path,body,expected", [
+        # Creating dataset with invalid data
+        ("post", "/api/v1/datasets/", {"name": "", "dimensions": 0, "metric_type": "invalid_metric"}, 422),
+        # Operations on non-existent dataset
+        ("get", "/api/v1/datasets/nonexistent", None, 404),
+        ("post", "/api/v1/datasets/nonexistent/vectors/", {"id": "test", "document_id": "test", "values": [0.1]}, 404),
+        ("post", "/api/v1/datasets/nonexistent/search", {"query_vector": [0.1], "options": {"top_k": 5}}, 404),
+    ], ids=["invalid-dataset", "get-nonexistent", "insert-nonexistent", "search-nonexistent"])
+    def test_error_scenario(self, client: TestClient, auth_headers, method, path, body, expected):
         """Test various error scenarios."""
+        kwargs = {"headers": auth_headers}
+        if body is not None:
+            kwargs["json"] = body
         
-        # Test creating dataset with invalid data
-        invalid_dataset = {
-            "name": "",  # Empty name
-            "dimensions": 0,  # Invalid dimensions
-            "metric_type": "invalid_metric"
-        }
-        
-        response = client.post(
-            "/api/v1/datasets/",
-            json=invalid_dataset,
-            headers=auth_headers
-        )
-        assert response.status_code == 422
-        
-        # Test operations on non-existent dataset
-        response = client.get("/api/v1/datasets/nonexistent", headers=auth_headers)
-        assert response.status_code == 404
-        
-        response = client.post(
-            "/api/v1/datasets/nonexistent/vectors/",
-            json={"id": "test", "document_id": "test", "values": [0.1]},
-            headers=auth_headers
-        )
-        assert response.status_code == 404
-        
-        response = client.post(
-            "/api/v1/datasets/nonexistent/search",
-            json={"query_vector": [0.1], "options": {"top_k": 5}},
-            headers=auth_headers
-        )
-        assert response.status_code == 404
+        response = getattr(client, method)(path, **kwargs)
+        assert response.status_code == expected
     
-    def test_authentication_flows(self, client: TestClient, auth_service):
+    def test_authentication_flows(self, client: TestClient, api_key: str, jwt_token: str):
         """Test different authentication methods."""
         
-        # Create test tenant
-        auth_service.create_tenant(
-            tenant_id="test-tenant",
-            name="Test Tenant",
-            permissions=["read", "write", "admin"]
-        )
-        
         # Test API key authentication
-        api_key = auth_service.generate_api_key(
-            tenant_id="test-tenant",
-            name="Test API Key",
-            permissions=["read", "write"]
-        )
-        
         api_key_headers = {
             "Authorization": f"ApiKey {api_key}",
             "Content-Type": "application/json"
@@ -178,13 +175,6 @@ class TestEndToEnd:
         assert response.status_code == 200
         
         # Test JWT token authentication
-        jwt_payload = {
-            "tenant_id": "test-tenant",
-            "user_id": "test-user",
-            "permissions": ["read", "write"]
-        }
-        jwt_token = auth_service.create_jwt_token(jwt_payload)
-        
         jwt_headers = {
             "Authorization": f"Bearer {jwt_token}",
             "Content-Type": "application/json"
@@ -198,35 +188,9 @@ class TestEndToEnd:
         response = client.get("/api/v1/datasets/", headers=invalid_headers)
         assert response.status_code == 401
     
-    def test_tenant_isolation(self, client: TestClient, auth_service):
+    def test_tenant_isolation(self, client: TestClient, tenant1_key: str, tenant2_key: str):
         """Test that tenants are properly isolated."""
         
-        # Create tenants
-        auth_service.create_tenant(
-            tenant_id="tenant1",
-            name="Tenant 1",
-            permissions=["read", "write", "admin"]
-        )
-        
-        auth_service.create_tenant(
-            tenant_id="tenant2",
-            name="Tenant 2",
-            permissions=["read", "write", "admin"]
-        )
-        
-        # Create API keys for different tenants
-        tenant1_key = auth_service.generate_api_key(
-            tenant_id="tenant1",
-            name="Tenant 1 Key",
-            permissions=["read", "write"]
-        )
-        
-        tenant2_key = auth_service.generate_api_key(
-            tenant_id="tenant2",
-            name="Tenant 2 Key", 
-            permissions=["read", "write"]
-        )
-        
         tenant1_headers = {"Authorization": f"ApiKey {tenant1_key}"}
         tenant2_headers = {"Authorization": f"ApiKey {tenant2_key}"}
         
@@ -264,17 +228,21 @@ class TestEndToEnd:
 
 
 @pytest.mark.integration
-@pytest.mark.slow
+@pytest.mark.xdist_group("perf")
 class TestPerformance:
     """Performance and load tests."""
     
-    def test_large_batch_insert(self, client: TestClient, auth_headers):
+    @pytest.mark.parametrize("batch_size,dim", [
+        (8, 32),  # Smoke size for the default run
+        pytest.param(100, 256, marks=pytest.mark.slow),
+    ])
+    def test_large_batch_insert(self, client: TestClient, auth_headers, batch_payloads, batch_size: int, dim: int):
         """Test inserting a large batch of vectors."""
         
         # Create dataset
         dataset_data = {
             "name": "performance-test",
-            "dimensions": 256,
+            "dimensions": dim,
             "metric_type": "cosine",
             "overwrite": True
         }
@@ -287,26 +255,11 @@ class TestPerformance:
         assert response.status_code == 201
         dataset_id = response.json()["id"]
         
-        # Create large batch of vectors
-        vectors = []
-        batch_size = 100  # Keep reasonable for tests
-        
-        for i in range(batch_size):
-            vector = {
-                "id": f"perf-vector-{i}",
-                "document_id": f"perf-doc-{i}",
-                "values": [0.1 + i * 0.001] * 256,
-                "content": f"Performance test content {i}",
-                "metadata": {"batch": "performance", "index": str(i)}
-            }
-            vectors.append(vector)
-        
-        # Insert batch
-        batch_data = {"vectors": vectors}
+        # Insert pre-encoded batch
         response = client.post(
             f"/api/v1/datasets/{dataset_id}/vectors/batch",
-            json=batch_data,
-            headers=auth_headers
+            content=batch_payloads(batch_size, dim),
+            headers={**auth_headers, "Content-Type": "application/json"}
         )
         
         assert response.status_code == 201
@@ -316,15 +269,10 @@ class TestPerformance:
         assert result["processing_time_ms"] > 0
         
         # Test search performance
-        search_data = {
-            "query_vector": [0.1] * 256,
-            "options": {"top_k": 10}
-        }
-        
         response = client.post(
             f"/api/v1/datasets/{dataset_id}/search",
-            json=search_data,
-            headers=auth_headers
+            content=_search_body(dim),
+            headers={**auth_headers, "Content-Type": "application/json"}
         )
         
         assert response.status_code == 200
@@ -0,0 +1,265 @@
+"""Integration tests for IVF index management and search on indexed datasets."""
+
+import time
+from functools import lru_cache
+from typing import AsyncGenerator
+
+import numpy as np
+import orjson
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient
+from pydantic import TypeAdapter
+
+from app.services.index_service import IndexStats
+
+# Run every test on the session event loop shared with the ``aclient`` fixture
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+IVF_DIMENSIONS = 128
+
+# Base seed for every vector drawn here. Vectors are drawn as whole float32
+# matrices and uploaded as raw bytes, never as per-row dicts.
+SEED = 1234
+
+# Document IDs the binary batch endpoint assigns to matrix rows, up to the
+# largest matrix inserted here
+DOC_IDS = tuple(f"doc-{i}" for i in range(1000))
+
+# IVF parameters used for the shared indexed dataset, encoded once
+IVF_PARAMS = {"index_type": "ivf", "ivf_nlist": 10, "ivf_nprobe": 5}
+_IVF_INDEX_BODY = orjson.dumps(IVF_PARAMS)
+
+# nlist below the accepted minimum of 10, rejected by request validation
+_INVALID_IVF_INDEX_BODY = orjson.dumps({"index_type": "ivf", "ivf_nlist": 1})
+
+# Index statistics are validated straight from the response bytes into the
+# endpoint's own response model, without building an intermediate dict
+INDEX_STATS = TypeAdapter(IndexStats)
+
+# Index types an IVF request can report. Deep Lake falls back to a flat
+# index when the dataset is too small for nlist or IVF is unsupported.
+IVF_RESULT_TYPES = ("ivf", "flat")
+
+# (vector_count, nlist, nprobe, allowed index types) for fresh IVF builds.
+# An IVF build needs at least 40 vectors per cluster, else it falls back to flat.
+IVF_BUILD_CASES = [
+    pytest.param(500, 10, 5, IVF_RESULT_TYPES, id="ivf"),
+    pytest.param(100, 10, 5, ("flat",), id="too-few-vectors"),
+]
+
+
+def _random_matrix(count: int, stream: int) -> np.ndarray:
+    """Draw ``count`` random float32 vectors as the rows of a matrix.
+
+    Each ``stream`` has its own generator, so a test sees the same vectors
+    whichever tests ran before it, on any xdist worker.
+    """
+    rng = np.random.default_rng((SEED, stream))
+    return rng.random((count, IVF_DIMENSIONS), dtype=np.float32)
+
+
+async def _insert_matrix(aclient: AsyncClient, auth_headers, dataset_id: str, matrix: np.ndarray):
+    """Insert the matrix rows as raw float32 in one request; row ``i`` becomes ``doc-{i}``."""
+    return await aclient.post(
+        f"/api/v1/datasets/{dataset_id}/vectors/batch/binary",
+        content=matrix.astype("<f4", copy=False).tobytes(),
+        headers={**auth_headers, "Content-Type": "application/octet-stream"}
+    )
+
+
+async def _search(aclient: AsyncClient, auth_headers, dataset_id: str, query_vector: np.ndarray, top_k: int) -> list:
+    """Run one vector search and return its results.
+
+    The query row is serialized by orjson straight from the array, without a
+    ``tolist()`` copy. Search responses carry every hit's 128D vector, so they
+    are parsed with orjson too.
+    """
+    body = {"query_vector": query_vector, "options": {"top_k": top_k}}
+    response = await aclient.post(
+        f"/api/v1/datasets/{dataset_id}/search",
+        content=orjson.dumps(body, option=orjson.OPT_SERIALIZE_NUMPY),
+        headers=auth_headers
+    )
+    assert response.status_code == 200
+    return orjson.loads(response.content)["results"]
+
+
+@lru_cache(maxsize=None)
+def _dataset_body(name: str, vector_dtype: str = "float32") -> bytes:
+    """Encoded create body for a 128D cosine IVF dataset called ``name``.
+
+    Vectors are stored at unit length so cosine search skips the row norms.
+    """
+    return orjson.dumps({
+        "name": name,
+        "dimensions": IVF_DIMENSIONS,
+        "metric_type": "cosine",
+        "index_type": "ivf",
+        "vector_dtype": vector_dtype,
+        "normalize_vectors": True,
+        "overwrite": True
+    })
+
+
+async def _create_dataset(aclient: AsyncClient, auth_headers, name: str, vector_dtype: str = "float32") -> str:
+    """Create a 128D cosine IVF dataset and return its id."""
+    response = await aclient.post("/api/v1/datasets/", content=_dataset_body(name, vector_dtype), headers=auth_headers)
+    assert response.status_code == 201
+    return response.json()["id"]
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def dataset_factory(aclient: AsyncClient, auth_headers) -> AsyncGenerator:
+    """Create IVF datasets for a single test and delete them on teardown.
+
+    Cleanup runs even when the test fails part-way through.
+    """
+    created = []
+
+    async def create(name: str, vector_dtype: str = "float32") -> str:
+        dataset_id = await _create_dataset(aclient, auth_headers, name, vector_dtype)
+        created.append(dataset_id)
+        return dataset_id
+
+    yield create
+
+    for dataset_id in created:
+        await aclient.delete(f"/api/v1/datasets/{dataset_id}", headers=auth_headers)
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def ivf_dataset(aclient: AsyncClient, auth_headers) -> AsyncGenerator[dict, None]:
+    """500-vector dataset with an IVF index, built once for the read-only tests.
+
+    Returns the dataset ``id`` and a 10-row ``query_vectors`` matrix.
+    """
+    dataset_id = await _create_dataset(aclient, auth_headers, "test-ivf-shared")
+
+    # A single request of raw float32 rows: 500 is well under the 1000-vector limit
+    response = await _insert_matrix(aclient, auth_headers, dataset_id, _random_matrix(500, stream=0))
+    assert response.status_code == 201
+    assert response.json()["inserted_count"] == 500
+
+    response = await aclient.post(f"/api/v1/datasets/{dataset_id}/index", content=_IVF_INDEX_BODY, headers=auth_headers)
+    assert response.status_code == 200
+
+    yield {
+        "id": dataset_id,
+        "query_vectors": _random_matrix(10, stream=1)
+    }
+
+    await aclient.delete(f"/api/v1/datasets/{dataset_id}", headers=auth_headers)
+
+
+@pytest.mark.integration
+class TestIVFIndexing:
+    """IVF index creation, statistics and search.
+
+    Tests with their own datasets are spread across xdist workers; the ones
+    sharing ``ivf_dataset`` are grouped so it is built on one worker only.
+    """
+
+    @pytest.mark.parametrize("vector_count,nlist,nprobe,index_types", IVF_BUILD_CASES)
+    async def test_ivf_build(
+        self,
+        aclient: AsyncClient,
+        auth_headers,
+        dataset_factory,
+        vector_count,
+        nlist,
+        nprobe,
+        index_types
+    ):
+        """Test a forced IVF build reports its index type, size and parameters."""
+        dataset_id = await dataset_factory(f"test-ivf-build-{vector_count}")
+
+        response = await _insert_matrix(aclient, auth_headers, dataset_id, _random_matrix(vector_count, stream=2))
+        assert response.status_code == 201
+
+        response = await aclient.post(
+            f"/api/v1/datasets/{dataset_id}/index",
+            content=orjson.dumps({"index_type": "ivf", "ivf_nlist": nlist, "ivf_nprobe": nprobe, "force_rebuild": True}),
+            headers=auth_headers
+        )
+        assert response.status_code == 200
+        stats = INDEX_STATS.validate_json(response.content)
+        assert stats.index_type in index_types
+        assert stats.total_vectors == vector_count
+        if stats.index_type == "ivf":
+            assert stats.parameters["nlist"] == nlist
+            assert stats.parameters["nprobe"] == nprobe
+
+    @pytest.mark.xdist_group("ivf-shared")
+    async def test_get_ivf_index_info(self, aclient: AsyncClient, auth_headers, ivf_dataset):
+        """Test reading index statistics for an indexed dataset."""
+        response = await aclient.get(f"/api/v1/datasets/{ivf_dataset['id']}/index", headers=auth_headers)
+        assert response.status_code == 200
+        stats = INDEX_STATS.validate_json(response.content)
+        assert stats.total_vectors == 500
+        assert stats.is_trained is True
+
+    @pytest.mark.xdist_group("ivf-shared")
+    async def test_ivf_index_parameters(self, aclient: AsyncClient, auth_headers, ivf_dataset):
+        """Test IVF parameters outside the accepted range are rejected before any build."""
+        response = await aclient.post(
+            f"/api/v1/datasets/{ivf_dataset['id']}/index",
+            content=_INVALID_IVF_INDEX_BODY,
+            headers=auth_headers
+        )
+        assert response.status_code == 422
+
+    @pytest.mark.slow
+    async def test_auto_ivf_indexing(self, aclient: AsyncClient, auth_headers, dataset_factory):
+        """Test inserting enough vectors into an IVF dataset keeps it searchable."""
+        dataset_id = await dataset_factory("test-ivf-auto")
+        matrix = _random_matrix(1000, stream=3)
+
+        # 1000 vectors is the threshold at which inserts trigger an index build
+        response = await _insert_matrix(aclient, auth_headers, dataset_id, matrix)
+        assert response.status_code == 201
+        assert response.json()["inserted_count"] == 1000
+
+        results = await _search(aclient, auth_headers, dataset_id, matrix[0], top_k=5)
+        assert len(results) == 5
+        assert results[0]["vector"]["document_id"] == DOC_IDS[0]
+
+    @pytest.mark.slow
+    @pytest.mark.xdist_group("ivf-shared")
+    async def test_ivf_search_performance(self, aclient: AsyncClient, auth_headers, ivf_dataset):
+        """Test searches over an IVF dataset return ranked results quickly."""
+        query_vectors = ivf_dataset["query_vectors"]
+        start_time = time.time()
+        for query_vector in query_vectors:
+            results = await _search(aclient, auth_headers, ivf_dataset["id"], query_vector, top_k=10)
+            scores = [result["score"] for result in results]
+            assert len(scores) == 10
+            assert all(a >= b for a, b in zip(scores, scores[1:]))
+        elapsed = time.time() - start_time
+
+        # Ten searches over 500 vectors should take well under a second each
+        assert elapsed / len(query_vectors) < 1.0
+
+    @pytest.mark.slow
+    async def test_ivf_search_float16_recall(self, aclient: AsyncClient, auth_headers, dataset_factory):
+        """Test half-precision storage keeps search recall against exact float32 ranking."""
+        dataset_id = await dataset_factory("test-ivf-float16", vector_dtype="float16")
+        matrix = _random_matrix(500, stream=4)
+        response = await _insert_matrix(aclient, auth_headers, dataset_id, matrix)
+        assert response.status_code == 201
+
+        response = await aclient.post(f"/api/v1/datasets/{dataset_id}/index", content=_IVF_INDEX_BODY, headers=auth_headers)
+        assert response.status_code == 200
+
+        # Exact cosine top 10 of each query over the float32 originals
+        queries = _random_matrix(10, stream=5)
+        unit_rows = matrix / np.linalg.norm(matrix, axis=1, keepdims=True)
+        expected = np.argsort(-(queries @ unit_rows.T), axis=1)[:, :10]
+
+        hits = 0
+        for query, expected_rows in zip(queries, expected):
+            results = await _search(aclient, auth_headers, dataset_id, query, top_k=10)
+            found = {result["vector"]["document_id"] for result in results}
+            hits += len(found.intersection(DOC_IDS[i] for i in expected_rows))
+
+        assert hits / expected.size >= 0.9
@@ -4,101 +4,119 @@ This test suite covers monitoring infrastructure and alerting system tests
 that were originally handled by the test-alerting.sh script.
 """
 
+import asyncio
 import pytest
 import requests
+from requests.adapters import HTTPAdapter
 import json
 import time
-from typing import Dict, Any, Optional
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from typing import Dict, Iterator
 from fastapi.testclient import TestClient
-from unittest.mock import patch
+from httpx import AsyncClient
 import urllib3
 
+from tests.fixtures.monitoring import monitoring_url
+
 # Disable SSL warnings for test environments
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
+# Top-level keys of the Prometheus/Alertmanager v1 API response envelope
+API_ENVELOPE_KEYS = frozenset({"data"})
+# Fields of the HealthResponse returned by /api/v1/health
+HEALTH_RESPONSE_KEYS = frozenset({"status", "service", "version", "timestamp", "dependencies"})
+
+# Stress test requests, built once and replayed by every concurrent call
+_STRESS_REQUEST_COUNT = 15
+_HEALTH_REQ = ("GET", "/api/v1/health")
+_INVALID_INSERT_REQ = ("POST", "/api/v1/datasets/nonexistent/vectors/")
+_INVALID_INSERT_KWARGS = {
+    "content": json.dumps({"invalid": "data"}).encode(),
+    "headers": {"Authorization": "ApiKey invalid-key", "Content-Type": "application/json"},
+}
+
+
+@pytest.fixture(scope="session")
+def http() -> Iterator[requests.Session]:
+    """Pooled HTTP session shared by all monitoring probes."""
+    session = requests.Session()
+    session.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+    yield session
+    session.close()
+
+
+@pytest.fixture(scope="session")
+def prometheus_url() -> str:
+    """Prometheus base URL."""
+    return monitoring_url("prometheus")
+
+
+@pytest.fixture(scope="session")
+def prom_data(http: requests.Session, prometheus_url: str) -> SimpleNamespace:
+    """Fetch Prometheus targets, rules and metric names once per session.
+
+    Skips every dependent test when Prometheus cannot serve them.
+    """
+    payloads = {}
+    endpoints = {
+        "targets": "/api/v1/targets",
+        "rules": "/api/v1/rules",
+        "metric_names": "/api/v1/label/__name__/values",
+    }
+    for name, path in endpoints.items():
+        try:
+            response = http.get(f"{prometheus_url}{path}", timeout=10)
+        except requests.RequestException as e:
+            pytest.skip(f"Prometheus not reachable at {prometheus_url}: {e}")
+        if response.status_code != 200:
+            pytest.skip(f"Prometheus {path} returned {response.status_code}")
+        payloads[name] = response.json()
+    
+    return SimpleNamespace(
+        targets=payloads["targets"],
+        rules=payloads["rules"],
+        metric_names=payloads["metric_names"].get("data", []),
+    )
+
+
+@pytest.fixture(scope="session")
+def health_response(bare_client: TestClient):
+    """Fetch ``/api/v1/health`` once for tests that only inspect the response."""
+    return bare_client.get("/api/v1/health")
+
 
 @pytest.mark.integration
 @pytest.mark.monitoring
+@pytest.mark.xdist_group("monitoring")
 class TestMonitoringInfrastructure:
     """Test monitoring infrastructure availability and configuration."""
     
-    @pytest.fixture(scope="class")
-    def monitoring_services(self) -> Dict[str, Dict[str, Any]]:
-        """Configuration for monitoring services."""
-        return {
-            "prometheus": {
-                "host": "localhost",
-                "port": 9090,
-                "health_path": "/-/healthy",
-                "metrics_path": "/api/v1/targets"
-            },
-            "alertmanager": {
-                "host": "localhost", 
-                "port": 9093,
-                "health_path": "/-/healthy",
-                "alerts_path": "/api/v1/alerts"
-            },
-            "grafana": {
-                "host": "localhost",
-                "port": 3000,
-                "health_path": "/api/health"
-            }
-        }
-    
-    def _check_service_health(self, service_config: Dict[str, Any]) -> bool:
-        """Check if a monitoring service is healthy."""
-        try:
-            url = f"http://{service_config['host']}:{service_config['port']}{service_config['health_path']}"
-            response = requests.get(url, timeout=5)
-            return response.status_code == 200
-        except (requests.RequestException, ConnectionError):
-            return False
-    
-    def test_prometheus_availability(self, monitoring_services: Dict[str, Dict[str, Any]]):
+    @pytest.mark.requires_service("prometheus")
+    def test_prometheus_availability(self, prom_data: SimpleNamespace):
         """Test that Prometheus is available and responding."""
-        prometheus_config = monitoring_services["prometheus"]
-        is_healthy = self._check_service_health(prometheus_config)
-        
-        if not is_healthy:
-            pytest.skip("Prometheus not available - monitoring infrastructure may not be running")
-        
         # Test metrics endpoint
-        metrics_url = f"http://{prometheus_config['host']}:{prometheus_config['port']}{prometheus_config['metrics_path']}"
-        response = requests.get(metrics_url, timeout=10)
-        assert response.status_code == 200
-        
-        data = response.json()
-        assert "data" in data
+        data = prom_data.targets
+        assert API_ENVELOPE_KEYS <= data.keys()
         assert "activeTargets" in data["data"]
     
-    def test_alertmanager_availability(self, monitoring_services: Dict[str, Dict[str, Any]]):
+    @pytest.mark.requires_service("alertmanager")
+    def test_alertmanager_availability(self, http: requests.Session):
         """Test that Alertmanager is available and responding."""
-        alertmanager_config = monitoring_services["alertmanager"]
-        is_healthy = self._check_service_health(alertmanager_config)
-        
-        if not is_healthy:
-            pytest.skip("Alertmanager not available - monitoring infrastructure may not be running")
-        
         # Test alerts endpoint
-        alerts_url = f"http://{alertmanager_config['host']}:{alertmanager_config['port']}{alertmanager_config['alerts_path']}"
-        response = requests.get(alerts_url, timeout=10)
+        response = http.get(f"{monitoring_url('alertmanager')}/api/v1/alerts", timeout=10)
         assert response.status_code == 200
         
         data = response.json()
-        assert "data" in data
+        assert API_ENVELOPE_KEYS <= data.keys()
     
-    def test_grafana_availability(self, monitoring_services: Dict[str, Dict[str, Any]]):
+    @pytest.mark.requires_service("grafana")
+    def test_grafana_availability(self, http: requests.Session):
         """Test that Grafana is available."""
-        grafana_config = monitoring_services["grafana"]
-        is_healthy = self._check_service_health(grafana_config)
-        
-        if not is_healthy:
-            pytest.skip("Grafana not available - monitoring infrastructure may not be running")
-        
         # Additional check for Grafana API
-        api_url = f"http://{grafana_config['host']}:{grafana_config['port']}/api/org"
+        api_url = f"{monitoring_url('grafana')}/api/org"
         try:
-            response = requests.get(api_url, timeout=10)
+            response = http.get(api_url, timeout=10)
             # Grafana may return 401 without auth, which is still a valid response indicating it's running
             assert response.status_code in [200, 401]
         except requests.RequestException:
@@ -107,23 +125,14 @@ class TestMonitoringInfrastructure:
 
 @pytest.mark.integration
 @pytest.mark.monitoring
+@pytest.mark.requires_service("prometheus")
+@pytest.mark.xdist_group("monitoring")
 class TestPrometheusIntegration:
     """Test Prometheus integration and metrics collection."""
     
-    @pytest.fixture
-    def prometheus_url(self) -> str:
-        """Prometheus base URL."""
-        return "http://localhost:9090"
-    
-    def test_prometheus_targets(self, prometheus_url: str):
+    def test_prometheus_targets(self, prom_data: SimpleNamespace):
         """Test that Prometheus targets are configured and healthy."""
-        try:
-            response = requests.get(f"{prometheus_url}/api/v1/targets", timeout=10)
-        except requests.RequestException:
-            pytest.skip("Prometheus not available")
-        
-        assert response.status_code == 200
-        data = response.json()
+        data = prom_data.targets
         
         targets = data.get("data", {}).get("activeTargets", [])
         assert len(targets) > 0, "No active targets found in Prometheus"
@@ -134,15 +143,9 @@ class TestPrometheusIntegration:
             for target in api_targets:
                 assert target["health"] == "up", f"DeepLake API target is down: {target}"
     
-    def test_prometheus_alert_rules(self, prometheus_url: str):
+    def test_prometheus_alert_rules(self, prom_data: SimpleNamespace):
         """Test that alert rules are loaded in Prometheus."""
-        try:
-            response = requests.get(f"{prometheus_url}/api/v1/rules", timeout=10)
-        except requests.RequestException:
-            pytest.skip("Prometheus not available")
-        
-        assert response.status_code == 200
-        data = response.json()
+        data = prom_data.rules
         
         groups = data.get("data", {}).get("groups", [])
         assert len(groups) > 0, "No rule groups found in Prometheus"
@@ -162,17 +165,9 @@ class TestPrometheusIntegration:
             if rule_name not in alert_rules:
                 pytest.skip(f"Alert rule '{rule_name}' not configured (may be optional)")
     
-    def test_prometheus_metrics_collection(self, prometheus_url: str):
+    def test_prometheus_metrics_collection(self, prom_data: SimpleNamespace):
         """Test that Prometheus is collecting DeepLake metrics."""
-        try:
-            response = requests.get(f"{prometheus_url}/api/v1/label/__name__/values", timeout=10)
-        except requests.RequestException:
-            pytest.skip("Prometheus not available")
-        
-        assert response.status_code == 200
-        data = response.json()
-        
-        metric_names = data.get("data", [])
+        metric_names = prom_data.metric_names
         
         # Check for key DeepLake metrics
         expected_metrics = [
@@ -193,6 +188,7 @@ class TestPrometheusIntegration:
 
 @pytest.mark.integration
 @pytest.mark.monitoring
+@pytest.mark.xdist_group("monitoring")
 class TestMetricsEndpoints:
     """Test metrics endpoints in the DeepLake API."""
     
@@ -235,25 +231,24 @@ class TestMetricsEndpoints:
 
 @pytest.mark.integration
 @pytest.mark.monitoring
+@pytest.mark.requires_service("alertmanager")
+@pytest.mark.xdist_group("monitoring")
 class TestAlertingSystem:
     """Test alerting system functionality."""
     
     @pytest.fixture
     def alertmanager_url(self) -> str:
-        """Alertmanager base URL.""" 
-        return "http://localhost:9093"
+        """Alertmanager base URL."""
+        return monitoring_url("alertmanager")
     
-    def test_send_test_alert(self, alertmanager_url: str):
+    def test_send_test_alert(
+        self,
+        alertmanager_url: str,
+        http: requests.Session
+    ):
         """Test sending a test alert to Alertmanager."""
-        try:
-            # Check if Alertmanager is available
-            health_response = requests.get(f"{alertmanager_url}/-/healthy", timeout=5)
-            if health_response.status_code != 200:
-                pytest.skip("Alertmanager not available")
-        except requests.RequestException:
-            pytest.skip("Alertmanager not available")
-        
-        # Create test alert
+        # Create test alert; both timestamps derive from a single clock read
+        now = datetime.now(timezone.utc)
         test_alert = {
             "labels": {
                 "alertname": "PytestTestAlert",
@@ -266,12 +261,12 @@ class TestAlertingSystem:
                 "summary": "Test alert from pytest",
                 "description": "This is a test alert generated by the pytest monitoring test suite"
             },
-            "startsAt": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
-            "endsAt": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(time.time() + 300))  # 5 minutes from now
+            "startsAt": now.isoformat().replace("+00:00", "Z"),
+            "endsAt": (now + timedelta(minutes=5)).isoformat().replace("+00:00", "Z")  # 5 minutes from now
         }
         
         # Send alert to Alertmanager
-        response = requests.post(
+        response = http.post(
             f"{alertmanager_url}/api/v1/alerts",
             json=[test_alert],
             headers={"Content-Type": "application/json"},
@@ -280,18 +275,15 @@ class TestAlertingSystem:
         
         assert response.status_code == 200, f"Failed to send test alert: {response.text}"
     
-    def test_alert_routing(self, alertmanager_url: str):
+    def test_alert_routing(self, alertmanager_url: str, http: requests.Session):
         """Test alert routing configuration."""
-        try:
-            response = requests.get(f"{alertmanager_url}/api/v1/status", timeout=10)
-        except requests.RequestException:
-            pytest.skip("Alertmanager not available")
+        response = http.get(f"{alertmanager_url}/api/v1/status", timeout=10)
         
         if response.status_code != 200:
             pytest.skip("Alertmanager status endpoint not available")
         
         data = response.json()
-        assert "data" in data
+        assert API_ENVELOPE_KEYS <= data.keys()
         
         # Basic validation that Alertmanager is configured
         config = data["data"].get("configYAML", "")
@@ -302,87 +294,61 @@ class TestAlertingSystem:
 @pytest.mark.integration
 @pytest.mark.monitoring
 @pytest.mark.slow
+@pytest.mark.xdist_group("monitoring")
 class TestMonitoringStressTests:
     """Stress tests for monitoring system."""
     
-    def test_metrics_under_load(self, client: TestClient, auth_headers: Dict[str, str]):
+    async def test_metrics_under_load(self, async_client: AsyncClient, auth_headers: Dict[str, str]):
         """Test that metrics collection works under load."""
-        import threading
-        import concurrent.futures
-        
-        def make_requests():
-            """Make multiple requests to generate metrics."""
-            responses = []
-            for _ in range(5):
-                try:
-                    response = client.get("/api/v1/health")
-                    responses.append(response.status_code)
-                except Exception as e:
-                    responses.append(str(e))
-            return responses
-        
         # Run concurrent requests
-        with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
-            futures = [executor.submit(make_requests) for _ in range(3)]
-            results = [future.result() for future in futures]
+        all_responses = await asyncio.gather(
+            *(async_client.request(*_HEALTH_REQ) for _ in range(_STRESS_REQUEST_COUNT)),
+            return_exceptions=True
+        )
         
         # Verify most requests succeeded
-        all_responses = [status for result in results for status in result]
-        success_count = sum(1 for status in all_responses if status == 200)
+        success_count = sum(
+            1 for response in all_responses
+            if not isinstance(response, BaseException) and response.status_code == 200
+        )
         assert success_count >= len(all_responses) * 0.8, "Too many failed requests under load"
         
         # Check that metrics endpoint still works after load
-        metrics_response = client.get("/api/v1/metrics/prometheus", headers=auth_headers)
+        metrics_response = await async_client.get("/api/v1/metrics/prometheus", headers=auth_headers)
         if metrics_response.status_code != 404:  # Skip if not implemented
             assert metrics_response.status_code == 200
     
-    def test_error_rate_simulation(self, client: TestClient):
+    async def test_error_rate_simulation(self, async_client: AsyncClient):
         """Test simulating high error rate for alerting."""
-        import threading
-        
-        error_responses = []
-        
-        def generate_errors():
-            """Generate error responses."""
-            for _ in range(5):
-                try:
-                    # Make requests that should result in errors
-                    response = client.post(
-                        "/api/v1/datasets/nonexistent/vectors/",
-                        json={"invalid": "data"},
-                        headers={"Authorization": "ApiKey invalid-key"}
-                    )
-                    error_responses.append(response.status_code)
-                except Exception as e:
-                    error_responses.append(str(e))
-        
-        # Generate errors concurrently
-        threads = []
-        for _ in range(3):
-            thread = threading.Thread(target=generate_errors)
-            threads.append(thread)
-            thread.start()
-        
-        for thread in threads:
-            thread.join()
+        # Generate errors concurrently with requests that should result in errors
+        error_responses = await asyncio.gather(
+            *(
+                async_client.request(*_INVALID_INSERT_REQ, **_INVALID_INSERT_KWARGS)
+                for _ in range(_STRESS_REQUEST_COUNT)
+            ),
+            return_exceptions=True
+        )
         
         # Verify we got expected error responses
-        error_count = sum(1 for status in error_responses if isinstance(status, int) and status >= 400)
+        error_count = sum(
+            1 for response in error_responses
+            if not isinstance(response, BaseException) and response.status_code >= 400
+        )
         assert error_count > 0, "No error responses generated for error rate test"
 
 
 @pytest.mark.integration
 @pytest.mark.monitoring
+@pytest.mark.xdist_group("monitoring")
 class TestServiceHealthChecks:
     """Test service health check mechanisms."""
     
-    def test_api_health_endpoint(self, client: TestClient):
+    def test_api_health_endpoint(self, health_response):
         """Test API health endpoint functionality."""
-        response = client.get("/api/v1/health")
-        assert response.status_code == 200
+        assert health_response.status_code == 200
         
-        health_data = response.json()
-        assert "status" in health_data
+        health_data = health_response.json()
+        assert HEALTH_RESPONSE_KEYS <= health_data.keys()
         assert health_data["status"] == "healthy"
         
         # Check for additional health information
@@ -405,11 +371,10 @@ class TestServiceHealthChecks:
         # Should get either success or auth-related error, not infrastructure error
         assert response.status_code in [200, 401, 403]
     
-    def test_redis_connectivity_health(self, client: TestClient):
+    def test_redis_connectivity_health(self, health_response):
         """Test Redis connectivity through cache operations.""" 
         # Health check should still work even if Redis is down
-        response = client.get("/api/v1/health")
-        assert response.status_code == 200
+        assert health_response.status_code == 200
         
         # But cache-dependent operations might be affected
         # This is tested implicitly through other API calls
@@ -417,22 +382,21 @@ class TestServiceHealthChecks:
 
 @pytest.mark.integration
 @pytest.mark.monitoring
+@pytest.mark.xdist_group("monitoring")
 class TestAlertScenarios:
     """Test specific alert scenarios."""
     
-    def test_service_availability_monitoring(self, client: TestClient):
+    def test_service_availability_monitoring(self, health_response):
         """Test that service availability can be monitored."""
         # Make sure service is responding
-        response = client.get("/api/v1/health")
-        assert response.status_code == 200
+        assert health_response.status_code == 200
         
         # This test mainly validates that the service is up
         # Actual downtime testing would require stopping the service
     
     def test_response_time_monitoring(self, client: TestClient, auth_headers: Dict[str, str]):
         """Test response time monitoring capability."""
-        import time
-        
+        # Timing needs a fresh request rather than the cached health_response
         start_time = time.time()
         response = client.get("/api/v1/health")
         end_time = time.time()
@@ -4,98 +4,114 @@ This test suite covers all the insert endpoint variations and error cases
 that were originally tested with curl commands.
 """
 
+import asyncio
+import random
+from functools import partial
+import numpy as np
+import orjson
 import pytest
-from fastapi.testclient import TestClient
+import pytest_asyncio
+from fastapi import HTTPException
+from httpx import AsyncClient
+from pydantic import ValidationError
 from typing import Dict, Any
 
+from app.models.schemas import VectorCreate
+
+# Run every test on the session event loop shared with the ``aclient`` fixture
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+CONCURRENT_INSERTS = 32
+
+# Single-insert happy-path payloads, posted once per session
+HAPPY_PATH_PAYLOADS = {
+    "plain": {
+        "document_id": "doc-1",
+        "values": [1.0, 0.5, 0.0],
+        "chunk_count": 1
+    },
+    "metadata": {
+        "document_id": "doc-2",
+        "values": [0.8, 0.2, 0.1],
+        "chunk_count": 1,
+        "content": "This is sample content",
+        "metadata": {
+            "category": "test",
+            "priority": "high"
+        }
+    },
+    "custom_id": {
+        "id": "custom-vector-123",
+        "document_id": "doc-3",
+        "values": [0.3, 0.7, 0.9],
+        "chunk_count": 1
+    },
+}
+
+# ~100KB metadata payload, built and encoded once at import
+LARGE_METADATA = {f"key_{i}": f"value_{i}" * 1000 for i in range(100)}
+LARGE_METADATA_BODY = orjson.dumps({
+    "document_id": "test-large-metadata",
+    "values": [1.0, 0.5, 0.0],
+    "chunk_count": 1,
+    "metadata": LARGE_METADATA
+})
+
+
+def _gen_vectors(n: int, seed: int = 0) -> list:
+    """Generate ``n`` random valid 3D vector payloads, reproducibly from ``seed``."""
+    rng = random.Random(seed)
+    return [
+        {"document_id": f"v-{i}", "values": [rng.random(), rng.random(), rng.random()], "chunk_count": 1}
+        for i in range(n)
+    ]
+
+
+@pytest_asyncio.fixture(scope="class", loop_scope="session")
+async def happy_path_responses(
+    aclient: AsyncClient,
+    dataset_3d: Dict[str, str],
+    auth_headers: Dict[str, str]
+) -> Dict[str, Dict[str, Any]]:
+    """Insert each happy-path payload once and share the responses across the class."""
+    responses = {}
+    for case, payload in HAPPY_PATH_PAYLOADS.items():
+        response = await aclient.post(dataset_3d["url"], json=payload, headers=auth_headers)
+        assert response.status_code == 201
+        responses[case] = response.json()
+    return responses
+
 
 class TestVectorInsertEndpoints:
     """Test vector insert endpoints with various scenarios."""
     
-    @pytest.fixture
-    def test_dataset_3d(self, client: TestClient, auth_headers: Dict[str, str]):
-        """Create a 3D test dataset for insert tests."""
-        dataset_data = {
-            "name": "test-dataset-3d",
-            "description": "3D test dataset for vector inserts",
-            "dimensions": 3,
-            "metric_type": "cosine",
-            "overwrite": True
-        }
-        response = client.post(
-            "/api/v1/datasets/",
-            json=dataset_data,
-            headers=auth_headers
-        )
-        assert response.status_code == 201
-        return response.json()["id"]
+    @pytest.fixture(autouse=True)
+    def _dataset_urls(self, dataset_3d: Dict[str, str]):
+        """Resolve the endpoint URLs for the shared 3D dataset."""
+        self.url = dataset_3d["url"]
+        self.batch_url = dataset_3d["batch_url"]
     
-    def test_successful_single_vector_insert(self, client: TestClient, test_dataset_3d: str, auth_headers: Dict[str, str]):
+    async def test_successful_single_vector_insert(self, happy_path_responses: Dict[str, Dict[str, Any]]):
         """Test successful single vector insert."""
-        vector_data = {
-            "document_id": "doc-1",
-            "values": [1.0, 0.5, 0.0],
-            "chunk_count": 1
-        }
-        
-        response = client.post(
-            f"/api/v1/datasets/{test_dataset_3d}/vectors/",
-            json=vector_data,
-            headers=auth_headers
-        )
-        
-        assert response.status_code == 201
-        data = response.json()
+        data = happy_path_responses["plain"]
         assert data["success"] is True
         assert data["inserted_count"] == 1
         assert data["failed_count"] == 0
         assert data["skipped_count"] == 0
     
-    def test_vector_insert_with_metadata(self, client: TestClient, test_dataset_3d: str, auth_headers: Dict[str, str]):
+    async def test_vector_insert_with_metadata(self, happy_path_responses: Dict[str, Dict[str, Any]]):
         """Test vector insert with metadata."""
-        vector_data = {
-            "document_id": "doc-2",
-            "values": [0.8, 0.2, 0.1],
-            "chunk_count": 1,
-            "content": "This is sample content",
-            "metadata": {
-                "category": "test",
-                "priority": "high"
-            }
-        }
-        
-        response = client.post(
-            f"/api/v1/datasets/{test_dataset_3d}/vectors/",
-            json=vector_data,
-            headers=auth_headers
-        )
-        
-        assert response.status_code == 201
-        data = response.json()
+        data = happy_path_responses["metadata"]
         assert data["success"] is True
         assert data["inserted_count"] == 1
     
-    def test_vector_insert_with_custom_id(self, client: TestClient, test_dataset_3d: str, auth_headers: Dict[str, str]):
+    async def test_vector_insert_with_custom_id(self, happy_path_responses: Dict[str, Dict[str, Any]]):
         """Test vector insert with custom ID."""
-        vector_data = {
-            "id": "custom-vector-123",
-            "document_id": "doc-3",
-            "values": [0.3, 0.7, 0.9],
-            "chunk_count": 1
-        }
-        
-        response = client.post(
-            f"/api/v1/datasets/{test_dataset_3d}/vectors/",
-            json=vector_data,
-            headers=auth_headers
-        )
-        
-        assert response.status_code == 201
-        data = response.json()
+        data = happy_path_responses["custom_id"]
         assert data["success"] is True
         assert data["inserted_count"] == 1
     
-    def test_invalid_vector_dimensions(self, client: TestClient, test_dataset_3d: str, auth_headers: Dict[str, str]):
+    async def test_invalid_vector_dimensions(self, aclient: AsyncClient, auth_headers: Dict[str, str]):
         """Test vector with invalid dimensions (should return 201 with failed_count)."""
         vector_data = {
             "document_id": "doc-4",
@@ -103,8 +119,8 @@ class TestVectorInsertEndpoints:
             "chunk_count": 1
         }
         
-        response = client.post(
-            f"/api/v1/datasets/{test_dataset_3d}/vectors/",
+        response = await aclient.post(
+            self.url,
             json=vector_data,
             headers=auth_headers
         )
@@ -116,59 +132,59 @@ class TestVectorInsertEndpoints:
         assert data["failed_count"] == 1
         # Note: The simplified endpoint doesn't return error_messages
     
-    def test_missing_required_fields(self, client: TestClient, test_dataset_3d: str, auth_headers: Dict[str, str]):
+    async def test_missing_required_fields(self, aclient: AsyncClient, auth_headers: Dict[str, str]):
         """Test vector with missing required fields (should return 422)."""
         vector_data = {
             "values": [1.0, 0.5, 0.0]
             # Missing document_id
         }
         
-        response = client.post(
-            f"/api/v1/datasets/{test_dataset_3d}/vectors/",
+        response = await aclient.post(
+            self.url,
             json=vector_data,
             headers=auth_headers
         )
         
         assert response.status_code == 422
     
-    def test_invalid_vector_values(self, client: TestClient, test_dataset_3d: str, auth_headers: Dict[str, str]):
-        """Test vector with invalid values (should trigger 500 and debugger)."""
+    @pytest.mark.slow
+    async def test_invalid_vector_values(self, aclient: AsyncClient, auth_headers: Dict[str, str]):
+        """Test vector with non-numeric values is rejected or fails gracefully."""
         vector_data = {
             "document_id": "doc-5",
             "values": [1.0, 0.5, "invalid"],  # String in values array
             "chunk_count": 1
         }
         
-        response = client.post(
-            f"/api/v1/datasets/{test_dataset_3d}/vectors/",
+        response = await aclient.post(
+            self.url,
             json=vector_data,
             headers=auth_headers
         )
         
-        # This should trigger the debugger breakpoint if it causes an unhandled exception
         assert response.status_code in [422, 500]  # Could be validation error or server error
     
-    def test_debugger_trigger_invalid_data(self, client: TestClient, test_dataset_3d: str, auth_headers: Dict[str, str]):
-        """Test designed to trigger the debugger on the simple insert endpoint."""
+    @pytest.mark.slow
+    async def test_extreme_float_values(self, aclient: AsyncClient, auth_headers: Dict[str, str]):
+        """Test vector with extreme float values on the simple insert endpoint."""
         # Create a vector with data that will pass validation but fail during processing
         # Using very large numbers that might cause issues in Deep Lake processing
         vector_data = {
-            "document_id": "debugger-test",
+            "document_id": "extreme-values-test",
             "values": [1e308, -1e308, 1e-308],  # Very large/small numbers that might cause issues
             "chunk_count": 1
         }
         
-        response = client.post(
-            f"/api/v1/datasets/{test_dataset_3d}/vectors/",
+        response = await aclient.post(
+            self.url,
             json=vector_data,
             headers=auth_headers
         )
         
-        # This should trigger the debugger at vectors.py:85 if it causes an unhandled exception
-        # during Deep Lake processing
+        # Exploratory: only checks that Deep Lake processing fails gracefully
         assert response.status_code in [201, 422, 500]
     
-    def test_nonexistent_dataset(self, client: TestClient, auth_headers: Dict[str, str]):
+    async def test_nonexistent_dataset(self, aclient: AsyncClient, auth_headers: Dict[str, str]):
         """Test insert into non-existent dataset."""
         vector_data = {
             "document_id": "doc-6",
@@ -176,7 +192,7 @@ class TestVectorInsertEndpoints:
             "chunk_count": 1
         }
         
-        response = client.post(
+        response = await aclient.post(
             "/api/v1/datasets/non-existent/vectors/",
             json=vector_data,
             headers=auth_headers
@@ -198,61 +214,72 @@ class TestVectorInsertEndpoints:
 class TestVectorBatchInsertEndpoints:
     """Test batch vector insert endpoints."""
     
-    @pytest.fixture
-    def test_dataset_3d_batch(self, client: TestClient, auth_headers: Dict[str, str]):
-        """Create a 3D test dataset for batch insert tests."""
-        dataset_data = {
-            "name": "test-dataset-batch",
-            "description": "3D test dataset for batch vector inserts",
-            "dimensions": 3,
-            "metric_type": "cosine",
-            "overwrite": True
-        }
-        response = client.post(
-            "/api/v1/datasets/",
-            json=dataset_data,
-            headers=auth_headers
-        )
-        assert response.status_code == 201
-        return response.json()["id"]
+    @pytest.fixture(autouse=True)
+    def _dataset_urls(self, dataset_3d: Dict[str, str]):
+        """Resolve the batch endpoint URL for the shared 3D dataset."""
+        self.batch_url = dataset_3d["batch_url"]
     
-    def test_batch_insert_multiple_vectors(self, client: TestClient, test_dataset_3d_batch: str, auth_headers: Dict[str, str]):
-        """Test batch insert with multiple vectors."""
+    @pytest.mark.parametrize("vectors,expected_inserted,expected_failed", [
+        pytest.param([
+            {"document_id": "batch-1", "values": [1.0, 0.0, 0.0], "chunk_count": 1},
+            {"document_id": "batch-2", "values": [0.0, 1.0, 0.0], "chunk_count": 1},
+            {"document_id": "batch-3", "values": [0.0, 0.0, 1.0], "chunk_count": 1}
+        ], 3, 0, id="all-valid"),
+        pytest.param([
+            {"document_id": "valid-1", "values": [1.0, 0.5, 0.0], "chunk_count": 1},
+            {"document_id": "invalid-dim", "values": [1.0, 0.5], "chunk_count": 1},  # Invalid dimensions
+            {"document_id": "valid-2", "values": [0.0, 0.5, 1.0], "chunk_count": 1}
+        ], 2, 1, id="mixed-valid-invalid"),
+        # Guards the bulk path against superlinear regressions; generated only
+        # when the case runs, not at collection
+        pytest.param(partial(_gen_vectors, 512), 512, 0, id="large-batch", marks=pytest.mark.slow),
+    ])
+    async def test_batch_insert(
+        self,
+        aclient: AsyncClient,
+        auth_headers: Dict[str, str],
+        vectors,
+        expected_inserted: int,
+        expected_failed: int
+    ):
+        """Test batch insert with valid, mixed and large batches."""
+        if callable(vectors):
+            vectors = vectors()
         batch_data = {
-            "vectors": [
-                {"document_id": "batch-1", "values": [1.0, 0.0, 0.0], "chunk_count": 1},
-                {"document_id": "batch-2", "values": [0.0, 1.0, 0.0], "chunk_count": 1},
-                {"document_id": "batch-3", "values": [0.0, 0.0, 1.0], "chunk_count": 1}
-            ],
+            "vectors": vectors,
             "skip_existing": False,
             "overwrite": False
         }
         
-        response = client.post(
-            f"/api/v1/datasets/{test_dataset_3d_batch}/vectors/batch",
-            json=batch_data,
-            headers=auth_headers
+        response = await aclient.post(
+            self.batch_url,
+            content=orjson.dumps(batch_data),
+            headers={**auth_headers, "Content-Type": "application/json"}
         )
         
         assert response.status_code == 201
         data = response.json()
-        assert data["inserted_count"] == 3
-        assert data["failed_count"] == 0
+        assert data["inserted_count"] == expected_inserted
+        assert data["failed_count"] == expected_failed
         assert data["skipped_count"] == 0
+        assert len(data["error_messages"]) == expected_failed
     
-    def test_batch_insert_with_skip_existing(self, client: TestClient, test_dataset_3d_batch: str, auth_headers: Dict[str, str]):
+    async def test_batch_insert_with_skip_existing(self, request, aclient: AsyncClient, auth_headers: Dict[str, str]):
         """Test batch insert with skip_existing option."""
+        # The dataset is shared across the session, so namespace the vector id
+        vector_id = f"{request.node.name}-duplicate-vector"
+        
         # First insert a vector
         initial_batch = {
             "vectors": [
-                {"id": "duplicate-vector", "document_id": "batch-4", "values": [0.5, 0.5, 0.5], "chunk_count": 1}
+                {"id": vector_id, "document_id": "batch-4", "values": [0.5, 0.5, 0.5], "chunk_count": 1}
             ],
             "skip_existing": False,
             "overwrite": False
         }
         
-        response1 = client.post(
-            f"/api/v1/datasets/{test_dataset_3d_batch}/vectors/batch",
+        response1 = await aclient.post(
+            self.batch_url,
             json=initial_batch,
             headers=auth_headers
         )
@@ -262,14 +289,14 @@ class TestVectorBatchInsertEndpoints:
         # Try to insert same vector with skip_existing=True
         duplicate_batch = {
             "vectors": [
-                {"id": "duplicate-vector", "document_id": "batch-4", "values": [0.5, 0.5, 0.5], "chunk_count": 1}
+                {"id": vector_id, "document_id": "batch-4", "values": [0.5, 0.5, 0.5], "chunk_count": 1}
             ],
             "skip_existing": True,
             "overwrite": False
         }
         
-        response2 = client.post(
-            f"/api/v1/datasets/{test_dataset_3d_batch}/vectors/batch",
+        response2 = await aclient.post(
+            self.batch_url,
             json=duplicate_batch,
             headers=auth_headers
         )
@@ -280,217 +307,192 @@ class TestVectorBatchInsertEndpoints:
         # So we'll accept either behavior for now
         assert data["inserted_count"] + data["skipped_count"] == 1
     
-    def test_batch_insert_mixed_valid_invalid(self, client: TestClient, test_dataset_3d_batch: str, auth_headers: Dict[str, str]):
-        """Test batch insert with mix of valid and invalid vectors."""
-        batch_data = {
-            "vectors": [
-                {"document_id": "valid-1", "values": [1.0, 0.5, 0.0], "chunk_count": 1},
-                {"document_id": "invalid-dim", "values": [1.0, 0.5], "chunk_count": 1},  # Invalid dimensions
-                {"document_id": "valid-2", "values": [0.0, 0.5, 1.0], "chunk_count": 1}
-            ],
-            "skip_existing": False,
-            "overwrite": False
-        }
-        
-        response = client.post(
-            f"/api/v1/datasets/{test_dataset_3d_batch}/vectors/batch",
-            json=batch_data,
-            headers=auth_headers
+    async def test_binary_batch_insert(self, aclient: AsyncClient, auth_headers: Dict[str, str]):
+        """Test batch insert of raw float32 rows."""
+        matrix = np.array([[1.0, 0.0, 0.0], [0.0, 1.0, 0.0]], dtype="<f4")
+        
+        response = await aclient.post(
+            f"{self.batch_url}/binary",
+            params={"document_id_prefix": "binary-"},
+            content=matrix.tobytes(),
+            headers={**auth_headers, "Content-Type": "application/octet-stream"}
         )
         
         assert response.status_code == 201
         data = response.json()
         assert data["inserted_count"] == 2
-        assert data["failed_count"] == 1
-        assert data["skipped_count"] == 0
-        assert len(data["error_messages"]) == 1
+        assert data["failed_count"] == 0
     
-    def test_batch_insert_unauthorized(self, client: TestClient, test_dataset_3d_batch: str):
-        """Test batch insert without authorization."""
-        batch_data = {
-            "vectors": [
-                {"document_id": "no-auth", "values": [1.0, 0.0, 0.0], "chunk_count": 1}
-            ]
-        }
+    async def test_binary_batch_insert_partial_row(self, aclient: AsyncClient, auth_headers: Dict[str, str]):
+        """Test a binary body that is not a whole number of rows is rejected."""
+        response = await aclient.post(
+            f"{self.batch_url}/binary",
+            content=np.ones(4, dtype="<f4").tobytes(),
+            headers={**auth_headers, "Content-Type": "application/octet-stream"}
+        )
         
-        response = client.post(
-            f"/api/v1/datasets/{test_dataset_3d_batch}/vectors/batch",
-            json=batch_data
+        assert response.status_code == 400
+    
+    async def test_binary_batch_insert_round_trip(
+        self,
+        aclient: AsyncClient,
+        auth_headers: Dict[str, str],
+        test_dataset_data: Dict[str, Any]
+    ):
+        """Test binary rows are stored under their generated document IDs with their exact values."""
+        # A dataset of this test's own, so searches only see the rows inserted here
+        response = await aclient.post(
+            "/api/v1/datasets/",
+            json={**test_dataset_data, "dimensions": 3},
+            headers=auth_headers
         )
+        assert response.status_code == 201
+        dataset_id = response.json()["id"]
+        matrix = np.array([[1.5, -2.25, 1e6], [0.0, 3.0, -0.125]], dtype="<f4")
+        
+        response = await aclient.post(
+            f"/api/v1/datasets/{dataset_id}/vectors/batch/binary",
+            params={"document_id_prefix": "row-", "start_index": 7},
+            content=matrix.tobytes(),
+            headers={**auth_headers, "Content-Type": "application/octet-stream"}
+        )
+        assert response.status_code == 201
+        
+        # Each row is its own nearest neighbour and comes back with its stored values
+        for document_id, row in zip(["row-7", "row-8"], matrix.tolist()):
+            response = await aclient.post(
+                f"/api/v1/datasets/{dataset_id}/search",
+                json={"query_vector": row, "options": {"top_k": 1}},
+                headers=auth_headers
+            )
+            assert response.status_code == 200
+            stored = response.json()["results"][0]["vector"]
+            assert stored["document_id"] == document_id
+            assert stored["values"] == row
         
-        # May return 500 if dependencies aren't available, but that's still an error state
-        assert response.status_code in [401, 500]
+        await aclient.delete(f"/api/v1/datasets/{dataset_id}", headers=auth_headers)
     
-    def test_batch_insert_invalid_auth(self, client: TestClient, test_dataset_3d_batch: str):
-        """Test batch insert with invalid auth token."""
-        batch_data = {
-            "vectors": [
-                {"document_id": "bad-auth", "values": [1.0, 0.0, 0.0], "chunk_count": 1}
-            ]
-        }
+    @pytest.mark.parametrize("value", [np.nan, np.inf, -np.inf], ids=["nan", "inf", "-inf"])
+    async def test_binary_batch_insert_non_finite(self, aclient: AsyncClient, auth_headers: Dict[str, str], value):
+        """Test binary rows holding NaN or infinity are rejected."""
+        matrix = np.array([[1.0, 0.0, 0.0], [0.0, value, 0.0]], dtype="<f4")
+        
+        response = await aclient.post(
+            f"{self.batch_url}/binary",
+            content=matrix.tobytes(),
+            headers={**auth_headers, "Content-Type": "application/octet-stream"}
+        )
         
-        headers = {"Authorization": "ApiKey invalid-token", "Content-Type": "application/json"}
-        response = client.post(
-            f"/api/v1/datasets/{test_dataset_3d_batch}/vectors/batch",
-            json=batch_data,
-            headers=headers
+        assert response.status_code == 400
+    
+    async def test_binary_batch_insert_too_many_vectors(self, aclient: AsyncClient, auth_headers: Dict[str, str]):
+        """Test a binary body over the 1000-vector limit is rejected."""
+        response = await aclient.post(
+            f"{self.batch_url}/binary",
+            content=np.ones((1001, 3), dtype="<f4").tobytes(),
+            headers={**auth_headers, "Content-Type": "application/octet-stream"}
         )
         
-        assert response.status_code == 401
+        assert response.status_code == 400
+    
+    async def test_batch_insert_unauthorized(self, authenticate):
+        """Test batch insert without authorization."""
+        with pytest.raises(HTTPException) as exc_info:
+            await authenticate({})
+        
+        assert exc_info.value.status_code == 401
+    
+    async def test_batch_insert_invalid_auth(self, authenticate):
+        """Test batch insert with invalid auth token."""
+        with pytest.raises(HTTPException) as exc_info:
+            await authenticate({"Authorization": "ApiKey invalid-token"})
+        
+        assert exc_info.value.status_code == 401
 
 
 class TestInsertEndpointErrorHandling:
     """Test comprehensive error handling for insert endpoints."""
     
-    @pytest.fixture
-    def test_dataset_errors(self, client: TestClient, auth_headers: Dict[str, str]):
-        """Create a test dataset for error handling tests."""
-        dataset_data = {
-            "name": "test-dataset-errors",
-            "description": "Test dataset for error handling",
-            "dimensions": 3,
-            "metric_type": "cosine",
-            "overwrite": True
-        }
-        response = client.post(
-            "/api/v1/datasets/",
-            json=dataset_data,
-            headers=auth_headers
-        )
-        assert response.status_code == 201
-        return response.json()["id"]
+    @pytest.fixture(autouse=True)
+    def _dataset_urls(self, dataset_3d: Dict[str, str]):
+        """Resolve the insert endpoint URL for the shared 3D dataset."""
+        self.url = dataset_3d["url"]
     
-    def test_malformed_json(self, client: TestClient, test_dataset_errors: str, auth_headers: Dict[str, str]):
+    async def test_malformed_json(self):
         """Test handling of malformed JSON."""
-        response = client.post(
-            f"/api/v1/datasets/{test_dataset_errors}/vectors/",
-            headers=auth_headers,
-            data='{"document_id": "test", "values": [1.0, 0.5, 0.0]'  # Missing closing brace
-        )
-        
-        assert response.status_code == 422
+        with pytest.raises(ValidationError):
+            VectorCreate.model_validate_json(
+                '{"document_id": "test", "values": [1.0, 0.5, 0.0]'  # Missing closing brace
+            )
     
-    def test_empty_request_body(self, client: TestClient, test_dataset_errors: str, auth_headers: Dict[str, str]):
+    async def test_empty_request_body(self):
         """Test handling of empty request body."""
-        response = client.post(
-            f"/api/v1/datasets/{test_dataset_errors}/vectors/",
-            headers=auth_headers,
-            data=""
-        )
-        
-        assert response.status_code == 422
+        with pytest.raises(ValidationError):
+            VectorCreate.model_validate_json("")
     
-    def test_invalid_content_type(self, client: TestClient, test_dataset_errors: str, auth_headers: Dict[str, str]):
+    async def test_invalid_content_type(self, aclient: AsyncClient, auth_headers: Dict[str, str]):
         """Test handling of invalid content type."""
         headers = {**auth_headers, "Content-Type": "text/plain"}
-        response = client.post(
-            f"/api/v1/datasets/{test_dataset_errors}/vectors/",
+        response = await aclient.post(
+            self.url,
             headers=headers,
-            data="not json"
+            content="not json"
         )
         
         assert response.status_code == 422
     
-    def test_vector_values_wrong_type(self, client: TestClient, test_dataset_errors: str, auth_headers: Dict[str, str]):
-        """Test vector with values field as wrong type."""
+    @pytest.mark.parametrize("values,expected", [
+        ("not-an-array", (422,)),  # Should be array
+        ([], (422,)),  # Empty values array fails validation at pydantic level
+        ([1.0, None, 0.0], (201, 422)),  # Null value in array; may fail validation or processing
+    ], ids=["wrong-type", "empty-array", "null-values"])
+    async def test_invalid_vector_values_payload(self, aclient: AsyncClient, auth_headers: Dict[str, str], values, expected):
+        """Test vectors whose values field is malformed."""
         vector_data = {
-            "document_id": "test-wrong-type",
-            "values": "not-an-array",  # Should be array
+            "document_id": "test-invalid-values",
+            "values": values,
             "chunk_count": 1
         }
         
-        response = client.post(
-            f"/api/v1/datasets/{test_dataset_errors}/vectors/",
+        response = await aclient.post(
+            self.url,
             json=vector_data,
             headers=auth_headers
         )
         
-        assert response.status_code == 422
+        assert response.status_code in expected
     
-    def test_vector_values_empty_array(self, client: TestClient, test_dataset_errors: str, auth_headers: Dict[str, str]):
-        """Test vector with empty values array."""
-        vector_data = {
-            "document_id": "test-empty-values",
-            "values": [],  # Empty array
-            "chunk_count": 1
-        }
-        
-        response = client.post(
-            f"/api/v1/datasets/{test_dataset_errors}/vectors/",
-            json=vector_data,
-            headers=auth_headers
-        )
-        
-        # Empty values array fails validation at pydantic level
-        assert response.status_code == 422
-    
-    def test_large_metadata_object(self, client: TestClient, test_dataset_errors: str, auth_headers: Dict[str, str]):
+    async def test_large_metadata_object(self, aclient: AsyncClient, auth_headers: Dict[str, str]):
         """Test vector with large metadata object."""
-        large_metadata = {f"key_{i}": f"value_{i}" * 1000 for i in range(100)}
-        vector_data = {
-            "document_id": "test-large-metadata",
-            "values": [1.0, 0.5, 0.0],
-            "chunk_count": 1,
-            "metadata": large_metadata
-        }
-        
-        response = client.post(
-            f"/api/v1/datasets/{test_dataset_errors}/vectors/",
-            json=vector_data,
-            headers=auth_headers
+        response = await aclient.post(
+            self.url,
+            content=LARGE_METADATA_BODY,
+            headers={**auth_headers, "Content-Type": "application/json"}
         )
         
         # Should either succeed or fail gracefully, not crash
         assert response.status_code in [201, 413, 422, 500]
     
-    def test_vector_with_null_values(self, client: TestClient, test_dataset_errors: str, auth_headers: Dict[str, str]):
-        """Test vector with null values in array."""
-        vector_data = {
-            "document_id": "test-null-values",
-            "values": [1.0, None, 0.0],  # Null value in array
-            "chunk_count": 1
-        }
-        
-        response = client.post(
-            f"/api/v1/datasets/{test_dataset_errors}/vectors/",
-            json=vector_data,
-            headers=auth_headers
-        )
-        
-        assert response.status_code in [201, 422]  # May fail validation or processing
-    
-    def test_concurrent_inserts(self, client: TestClient, test_dataset_errors: str, auth_headers: Dict[str, str]):
+    async def test_concurrent_inserts(
+        self,
+        aclient: AsyncClient,
+        auth_headers: Dict[str, str]
+    ):
         """Test concurrent vector inserts to same dataset."""
-        import threading
-        import time
-        
-        results = []
-        
-        def insert_vector(vector_id: str):
+        async def insert_vector(i: int):
             vector_data = {
-                "id": f"concurrent-{vector_id}",
-                "document_id": f"doc-{vector_id}",
-                "values": [float(vector_id), 0.5, 0.0],
+                "id": f"concurrent-{i}",
+                "document_id": f"doc-{i}",
+                "values": [float(i), 0.5, 0.0],
                 "chunk_count": 1
             }
-            
-            response = client.post(
-                f"/api/v1/datasets/{test_dataset_errors}/vectors/",
+            return await aclient.post(
+                self.url,
                 json=vector_data,
                 headers=auth_headers
             )
-            results.append(response.status_code)
-        
-        # Start multiple threads
-        threads = []
-        for i in range(5):
-            thread = threading.Thread(target=insert_vector, args=(str(i),))
-            threads.append(thread)
-            thread.start()
         
-        # Wait for all threads to complete
-        for thread in threads:
-            thread.join()
+        responses = await asyncio.gather(*(insert_vector(i) for i in range(CONCURRENT_INSERTS)))
         
         # All requests should succeed
-        assert all(status == 201 for status in results)
+        assert all(response.status_code == 201 for response in responses)
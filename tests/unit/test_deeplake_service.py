@@ -1,7 +1,10 @@
 """Unit tests for Deep Lake service."""
 
 import pytest
+import pytest_asyncio
 import os
+import numpy as np
+from types import SimpleNamespace
 from app.services.deeplake_service import DeepLakeService
 from app.models.schemas import DatasetCreate, VectorCreate, SearchOptions
 from app.models.exceptions import (
@@ -10,109 +13,119 @@ from app.models.exceptions import (
 )
 
 
+POPULATED_TENANT = "populated-dataset-tenant"
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def populated_dataset(deeplake_service: DeepLakeService) -> SimpleNamespace:
+    """Create and populate one 128-d dataset shared by the read-only tests."""
+    dataset = await deeplake_service.create_dataset(
+        DatasetCreate(
+            name="populated-dataset",
+            description="Shared dataset for read-only service tests",
+            dimensions=128,
+            metric_type="cosine",
+            overwrite=True
+        ),
+        POPULATED_TENANT
+    )
+    insert_result = await deeplake_service.insert_vectors(
+        dataset_id=dataset.id,
+        vectors=[VectorCreate(
+            id="populated-vector-1",
+            document_id="populated-doc-1",
+            values=[0.1] * 128,
+            content="This is test content"
+        )],
+        tenant_id=POPULATED_TENANT
+    )
+    return SimpleNamespace(dataset=dataset, insert_result=insert_result, tenant_id=POPULATED_TENANT)
+
+
 @pytest.mark.asyncio
 class TestDeepLakeService:
     """Test cases for Deep Lake service."""
     
-    async def test_create_dataset(self, deeplake_service: DeepLakeService, test_dataset_data):
+    async def test_create_dataset(self, deeplake_service: DeepLakeService, tenant_id: str, dataset_create: DatasetCreate):
         """Test dataset creation."""
-        dataset_create = DatasetCreate(**test_dataset_data)
-        
-        dataset = await deeplake_service.create_dataset(dataset_create, "default")
+        dataset = await deeplake_service.create_dataset(dataset_create, tenant_id)
         
-        assert dataset.name == test_dataset_data["name"]
-        assert dataset.description == test_dataset_data["description"]
-        assert dataset.dimensions == test_dataset_data["dimensions"]
-        assert dataset.metric_type == test_dataset_data["metric_type"]
+        assert dataset.name == dataset_create.name
+        assert dataset.description == dataset_create.description
+        assert dataset.dimensions == dataset_create.dimensions
+        assert dataset.metric_type == dataset_create.metric_type
         assert dataset.vector_count == 0
     
-    async def test_create_duplicate_dataset(self, deeplake_service: DeepLakeService, test_dataset_data):
+    async def test_create_duplicate_dataset(self, deeplake_service: DeepLakeService, tenant_id: str, dataset_create: DatasetCreate):
         """Test creating a duplicate dataset without overwrite."""
-        dataset_create = DatasetCreate(**test_dataset_data)
-        
         # Create the dataset first time
-        await deeplake_service.create_dataset(dataset_create, "default")
+        await deeplake_service.create_dataset(dataset_create, tenant_id)
         
         # Try to create again without overwrite
-        dataset_create.overwrite = False
         with pytest.raises(DatasetAlreadyExistsException):
-            await deeplake_service.create_dataset(dataset_create, "default")
+            await deeplake_service.create_dataset(
+                dataset_create.model_copy(update={"overwrite": False}), tenant_id
+            )
     
-    async def test_get_dataset(self, deeplake_service: DeepLakeService, test_dataset_data):
+    async def test_get_dataset(self, deeplake_service: DeepLakeService, tenant_id: str, dataset_create: DatasetCreate):
         """Test getting dataset information."""
-        dataset_create = DatasetCreate(**test_dataset_data)
-        created_dataset = await deeplake_service.create_dataset(dataset_create, "default")
+        created_dataset = await deeplake_service.create_dataset(dataset_create, tenant_id)
         
-        retrieved_dataset = await deeplake_service.get_dataset(created_dataset.id, "default")
+        retrieved_dataset = await deeplake_service.get_dataset(created_dataset.id, tenant_id)
         
         assert retrieved_dataset.id == created_dataset.id
         assert retrieved_dataset.name == created_dataset.name
         assert retrieved_dataset.dimensions == created_dataset.dimensions
     
-    async def test_get_nonexistent_dataset(self, deeplake_service: DeepLakeService):
+    async def test_get_nonexistent_dataset(self, deeplake_service: DeepLakeService, tenant_id: str):
         """Test getting a non-existent dataset."""
         with pytest.raises(DatasetNotFoundException):
-            await deeplake_service.get_dataset("nonexistent-dataset", "default")
+            await deeplake_service.get_dataset("nonexistent-dataset", tenant_id)
     
-    async def test_list_datasets(self, deeplake_service: DeepLakeService, test_dataset_data):
+    async def test_list_datasets(self, deeplake_service: DeepLakeService, tenant_id: str, dataset_create: DatasetCreate):
         """Test listing datasets."""
         # Initially empty
-        datasets = await deeplake_service.list_datasets("default")
+        datasets = await deeplake_service.list_datasets(tenant_id)
         initial_count = len(datasets)
         
         # Create a dataset
-        dataset_create = DatasetCreate(**test_dataset_data)
-        await deeplake_service.create_dataset(dataset_create, "default")
+        await deeplake_service.create_dataset(dataset_create, tenant_id)
         
         # Check list again
-        datasets = await deeplake_service.list_datasets("default")
+        datasets = await deeplake_service.list_datasets(tenant_id)
         assert len(datasets) == initial_count + 1
-        assert any(d.name == test_dataset_data["name"] for d in datasets)
+        assert any(d.name == dataset_create.name for d in datasets)
     
-    async def test_delete_dataset(self, deeplake_service: DeepLakeService, test_dataset_data):
+    async def test_delete_dataset(self, deeplake_service: DeepLakeService, tenant_id: str, dataset_create: DatasetCreate):
         """Test dataset deletion."""
-        dataset_create = DatasetCreate(**test_dataset_data)
-        created_dataset = await deeplake_service.create_dataset(dataset_create, "default")
+        created_dataset = await deeplake_service.create_dataset(dataset_create, tenant_id)
         
         # Delete the dataset
-        await deeplake_service.delete_dataset(created_dataset.id, "default")
+        await deeplake_service.delete_dataset(created_dataset.id, tenant_id)
         
         # Verify it's gone
         with pytest.raises(DatasetNotFoundException):
-            await deeplake_service.get_dataset(created_dataset.id, "default")
+            await deeplake_service.get_dataset(created_dataset.id, tenant_id)
     
-    async def test_insert_vectors(self, deeplake_service: DeepLakeService, test_dataset_data, test_vector_data):
+    async def test_insert_vectors(self, deeplake_service: DeepLakeService, populated_dataset: SimpleNamespace):
         """Test vector insertion."""
-        # Create dataset first
-        dataset_create = DatasetCreate(**test_dataset_data)
-        dataset = await deeplake_service.create_dataset(dataset_create, "default")
-        
-        # Insert vector
-        vector_create = VectorCreate(**test_vector_data)
-        result = await deeplake_service.insert_vectors(
-            dataset_id=dataset.id,
-            vectors=[vector_create],
-            tenant_id="default"
-        )
-        
+        result = populated_dataset.insert_result
         assert result.inserted_count == 1
         assert result.failed_count == 0
         assert len(result.error_messages) == 0
+        
+        dataset = await deeplake_service.get_dataset(populated_dataset.dataset.id, populated_dataset.tenant_id)
+        assert dataset.vector_count == 1
     
-    async def test_insert_vector_wrong_dimensions(self, deeplake_service: DeepLakeService, test_dataset_data, test_vector_data):
+    async def test_insert_vector_wrong_dimensions(self, deeplake_service: DeepLakeService, populated_dataset: SimpleNamespace, test_vector_data):
         """Test inserting vector with wrong dimensions."""
-        # Create dataset with specific dimensions
-        dataset_create = DatasetCreate(**test_dataset_data)
-        dataset_create.dimensions = 256  # Different from test vector
-        dataset = await deeplake_service.create_dataset(dataset_create, "default")
-        
-        # Try to insert vector with wrong dimensions
-        vector_create = VectorCreate(**test_vector_data)  # Has 128 dimensions
+        # Try to insert a vector that doesn't match the dataset's 128 dimensions
+        vector_create = VectorCreate(**{**test_vector_data, "values": [0.1] * 256})
         
         result = await deeplake_service.insert_vectors(
-            dataset_id=dataset.id,
+            dataset_id=populated_dataset.dataset.id,
             vectors=[vector_create],
-            tenant_id="default"
+            tenant_id=populated_dataset.tenant_id
         )
         
         # Should handle dimension error as soft failure
@@ -121,33 +134,117 @@ class TestDeepLakeService:
         assert len(result.error_messages) == 1
         assert "dimensions mismatch" in result.error_messages[0].lower()
     
-    async def test_search_vectors(self, deeplake_service: DeepLakeService, test_dataset_data, test_vector_data, test_search_data):
+    async def test_search_vectors(self, deeplake_service: DeepLakeService, populated_dataset: SimpleNamespace, test_search_data):
         """Test vector search."""
-        # Create dataset and insert vector
-        dataset_create = DatasetCreate(**test_dataset_data)
-        dataset = await deeplake_service.create_dataset(dataset_create, "default")
-        
-        vector_create = VectorCreate(**test_vector_data)
-        await deeplake_service.insert_vectors(
-            dataset_id=dataset.id,
-            vectors=[vector_create],
-            tenant_id="default"
-        )
-        
         # Search for similar vectors
         search_options = SearchOptions(**test_search_data["options"])
         result = await deeplake_service.search_vectors(
-            dataset_id=dataset.id,
+            dataset_id=populated_dataset.dataset.id,
             query_vector=test_search_data["query_vector"],
             options=search_options,
-            tenant_id="default"
+            tenant_id=populated_dataset.tenant_id
         )
         
         assert len(result.results) >= 0  # May be 0 if no similar vectors found
         assert result.total_found >= 0
         assert result.query_time_ms > 0
     
-    async def test_search_nonexistent_dataset(self, deeplake_service: DeepLakeService, test_search_data):
+    @pytest.mark.parametrize("block_bytes", [DeepLakeService.SEARCH_BLOCK_BYTES, 8], ids=["default-block", "row-blocks"])
+    async def test_search_vectors_score_filters(self, monkeypatch, deeplake_service: DeepLakeService, tenant_id: str, dataset_create: DatasetCreate, block_bytes: int):
+        """Test score filters keep only the best-ranked vectors, however candidates are blocked."""
+        monkeypatch.setattr(deeplake_service, "SEARCH_BLOCK_BYTES", block_bytes)
+        dataset = await deeplake_service.create_dataset(dataset_create.model_copy(update={"dimensions": 2}), tenant_id)
+        await deeplake_service.insert_vectors(
+            dataset_id=dataset.id,
+            vectors=[
+                VectorCreate(id=f"vector-{i}", document_id=f"doc-{i}", values=[1.0, float(i)])
+                for i in range(4)
+            ],
+            tenant_id=tenant_id
+        )
+        
+        # Cosine similarity to (1, 0) is 1 / sqrt(1 + i^2): 1.0, 0.707, 0.447, 0.316
+        for options in (SearchOptions(min_score=0.5), SearchOptions(threshold=0.5), SearchOptions(max_distance=0.5)):
+            result = await deeplake_service.search_vectors(
+                dataset_id=dataset.id,
+                query_vector=[1.0, 0.0],
+                options=options,
+                tenant_id=tenant_id
+            )
+            assert [item.vector.id for item in result.results] == ["vector-0", "vector-1"]
+    
+    async def test_float16_dataset(self, deeplake_service: DeepLakeService, tenant_id: str, dataset_create: DatasetCreate):
+        """Test vectors stored at half precision are searched in float32."""
+        dataset = await deeplake_service.create_dataset(
+            dataset_create.model_copy(update={"dimensions": 3, "vector_dtype": "float16"}), tenant_id
+        )
+        assert dataset.vector_dtype == "float16"
+        assert (await deeplake_service.get_dataset(dataset.id, tenant_id)).vector_dtype == "float16"
+        
+        await deeplake_service.insert_vectors(
+            dataset_id=dataset.id,
+            vectors=[VectorCreate(id="half-vector", document_id="half-doc", values=[0.1, 0.2, 0.3])],
+            tenant_id=tenant_id
+        )
+        result = await deeplake_service.search_vectors(
+            dataset_id=dataset.id,
+            query_vector=[0.1, 0.2, 0.3],
+            options=SearchOptions(top_k=1),
+            tenant_id=tenant_id
+        )
+        
+        assert result.results[0].vector.id == "half-vector"
+        assert result.results[0].score == pytest.approx(1.0, abs=1e-3)
+    
+    async def test_search_scores_every_row(self, deeplake_service: DeepLakeService, tenant_id: str, dataset_create: DatasetCreate):
+        """Test the nearest vector is found when it is stored after the first top_k * 10 rows."""
+        dataset = await deeplake_service.create_dataset(dataset_create.model_copy(update={"dimensions": 2}), tenant_id)
+        
+        # Twenty far vectors ahead of the match in storage order
+        await deeplake_service.insert_vectors(
+            dataset_id=dataset.id,
+            vectors=[VectorCreate(id=f"far-{i}", document_id=f"doc-{i}", values=[1.0, 0.0]) for i in range(20)]
+            + [VectorCreate(id="match", document_id="doc-match", values=[0.0, 1.0])],
+            tenant_id=tenant_id
+        )
+        result = await deeplake_service.search_vectors(
+            dataset_id=dataset.id,
+            query_vector=[0.0, 1.0],
+            options=SearchOptions(top_k=1),
+            tenant_id=tenant_id
+        )
+        
+        assert result.results[0].vector.id == "match"
+    
+    async def test_normalized_dataset(self, deeplake_service: DeepLakeService, tenant_id: str, dataset_create: DatasetCreate):
+        """Test vectors are stored at unit length and still score by cosine."""
+        dataset = await deeplake_service.create_dataset(
+            dataset_create.model_copy(update={"dimensions": 2, "normalize_vectors": True}), tenant_id
+        )
+        assert dataset.normalize_vectors is True
+        assert (await deeplake_service.get_dataset(dataset.id, tenant_id)).normalize_vectors is True
+        
+        await deeplake_service.insert_vectors(
+            dataset_id=dataset.id,
+            vectors=[
+                VectorCreate(id="long-vector", document_id="doc-1", values=[3.0, 4.0]),
+                VectorCreate(id="zero-vector", document_id="doc-2", values=[0.0, 0.0])
+            ],
+            tenant_id=tenant_id
+        )
+        result = await deeplake_service.search_vectors(
+            dataset_id=dataset.id,
+            query_vector=[6.0, 8.0],
+            options=SearchOptions(top_k=2),
+            tenant_id=tenant_id
+        )
+        
+        assert [item.vector.id for item in result.results] == ["long-vector", "zero-vector"]
+        assert result.results[0].vector.values == pytest.approx([0.6, 0.8])
+        assert result.results[0].score == pytest.approx(1.0)
+        assert result.results[1].score == 0.0
+    
+    async def test_search_nonexistent_dataset(self, deeplake_service: DeepLakeService, tenant_id: str, test_search_data):
         """Test searching in a non-existent dataset."""
         search_options = SearchOptions(**test_search_data["options"])
         
@@ -156,20 +253,106 @@ class TestDeepLakeService:
                 dataset_id="nonexistent-dataset",
                 query_vector=test_search_data["query_vector"],
                 options=search_options,
-                tenant_id="default"
+                tenant_id=tenant_id
             )
     
-    async def test_tenant_isolation(self, deeplake_service: DeepLakeService, test_dataset_data):
+    async def test_tenant_isolation(self, deeplake_service: DeepLakeService, tenant_id: str, dataset_create: DatasetCreate):
         """Test that datasets are isolated by tenant."""
-        dataset_create = DatasetCreate(**test_dataset_data)
+        tenant1 = f"{tenant_id}-tenant1"
+        tenant2 = f"{tenant_id}-tenant2"
         
         # Create dataset for tenant1
-        dataset1 = await deeplake_service.create_dataset(dataset_create, "tenant1")
+        dataset1 = await deeplake_service.create_dataset(dataset_create, tenant1)
         
         # Try to access from tenant2
         with pytest.raises(DatasetNotFoundException):
-            await deeplake_service.get_dataset(dataset1.id, "tenant2")
+            await deeplake_service.get_dataset(dataset1.id, tenant2)
         
         # List datasets for tenant2 should be empty
-        datasets = await deeplake_service.list_datasets("tenant2")
-        assert len(datasets) == 0
\ No newline at end of file
+        datasets = await deeplake_service.list_datasets(tenant2)
+        assert len(datasets) == 0
+
+
+class TestScoreCandidates:
+    """Test cases for batched candidate scoring."""
+    
+    def test_cosine_scores(self):
+        """Test cosine scoring, including a zero-norm candidate."""
+        candidates = np.array([[1.0, 0.0], [0.0, 1.0], [0.0, 0.0]], dtype=np.float32)
+        query = np.array([2.0, 0.0], dtype=np.float32)
+        
+        scores, distances = DeepLakeService._score_candidates(query, candidates, "cosine")
+        
+        np.testing.assert_allclose(scores, [1.0, 0.0, 0.0], atol=1e-6)
+        np.testing.assert_allclose(distances, [0.0, 1.0, 1.0], atol=1e-6)
+    
+    def test_l2_scores(self):
+        """Test non-cosine metrics are scored by L2 distance."""
+        candidates = np.array([[1.0, 1.0], [4.0, 5.0]], dtype=np.float32)
+        query = np.array([1.0, 1.0], dtype=np.float32)
+        
+        scores, distances = DeepLakeService._score_candidates(query, candidates, "euclidean")
+        
+        np.testing.assert_allclose(distances, [0.0, 5.0], atol=1e-6)
+        np.testing.assert_allclose(scores, [1.0, 1.0 / 6.0], atol=1e-6)
+    
+    @pytest.mark.parametrize("magnitude", [1e9, 1e19])
+    def test_cosine_large_magnitude(self, monkeypatch, magnitude):
+        """Test an identical large-magnitude candidate scores 1 without float32 overflow."""
+        monkeypatch.setattr("app.services.deeplake_service.HAS_SIMSIMD", False)
+        query = np.full(128, magnitude, dtype=np.float32)
+        candidates = np.stack([query, -query])
+        
+        scores, distances = DeepLakeService._score_candidates(query, candidates, "cosine")
+        
+        np.testing.assert_allclose(scores, [1.0, -1.0], atol=1e-5)
+        np.testing.assert_allclose(distances, [0.0, 2.0], atol=1e-5)
+    
+    def test_normalized_cosine_matches_full(self):
+        """Test the unit-row cosine shortcut scores like the full cosine path."""
+        rng = np.random.default_rng(0)
+        candidates = rng.random((64, 32), dtype=np.float32)
+        candidates /= np.linalg.norm(candidates, axis=1, keepdims=True)
+        candidates[0] = 0.0
+        query = rng.random(32, dtype=np.float32) * 5.0
+        
+        expected = DeepLakeService._score_candidates(query, candidates, "cosine")
+        actual = DeepLakeService._score_candidates(query, candidates, "cosine", normalized=True)
+        
+        np.testing.assert_allclose(actual[0], expected[0], atol=1e-5)
+        np.testing.assert_allclose(actual[1], expected[1], atol=1e-5)
+    
+    @pytest.mark.parametrize("metric_type", ["cosine", "euclidean"])
+    def test_simsimd_matches_numpy(self, monkeypatch, metric_type):
+        """Test the SimSIMD kernels score like the NumPy fallback."""
+        pytest.importorskip("simsimd")
+        rng = np.random.default_rng(0)
+        candidates = rng.random((64, 32), dtype=np.float32)
+        candidates[0] = 0.0
+        query = rng.random(32, dtype=np.float32)
+        
+        expected = DeepLakeService._score_candidates_simsimd(query, candidates, metric_type)
+        monkeypatch.setattr("app.services.deeplake_service.HAS_SIMSIMD", False)
+        actual = DeepLakeService._score_candidates(query, candidates, metric_type)
+        
+        np.testing.assert_allclose(actual[0], expected[0], atol=1e-4)
+        np.testing.assert_allclose(actual[1], expected[1], atol=1e-4)
+    
+    @pytest.mark.parametrize("metric_type", ["cosine", "euclidean"])
+    def test_simsimd_matches_numpy_near_duplicates(self, monkeypatch, metric_type):
+        """Test both paths agree on near-duplicate rows with large values."""
+        pytest.importorskip("simsimd")
+        rng = np.random.default_rng(0)
+        query = rng.random(128, dtype=np.float32) * 10.0
+        candidates = query + rng.uniform(-1e-3, 1e-3, (16, 128)).astype(np.float32)
+        candidates[0] = query + np.float32(1e-3)
+        
+        expected = DeepLakeService._score_candidates_simsimd(query, candidates, metric_type)
+        monkeypatch.setattr("app.services.deeplake_service.HAS_SIMSIMD", False)
+        actual = DeepLakeService._score_candidates(query, candidates, metric_type)
+        
+        np.testing.assert_allclose(actual[0], expected[0], rtol=1e-3, atol=1e-6)
+        np.testing.assert_allclose(actual[1], expected[1], rtol=1e-3, atol=1e-6)
+        if metric_type == "euclidean":
+            # A 1e-3 offset in each of 128 dimensions is sqrt(128) * 1e-3 away
+            assert actual[1][0] == pytest.approx(np.sqrt(128) * 1e-3, rel=1e-2)